@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+"""
+Benchmark comparable-property extraction for CMA reports.
+
+Builds synthetic listing snippets and compares:
+1. The original helpers (`extract_price_from_text` + `calculate_price_per_sqft`),
+   which only recover the price
+2. The original helpers plus one `re.search` per extra field (beds, baths,
+   sqft, sold date), i.e. what the structured record costs without fusing
+3. `extract_comparable`: one precompiled regex, one pass, typed record
+
+It also checks that the single-pass price agrees with `extract_price_from_text`,
+except where the original reads a word starting with a scale letter as a
+price ("2 miles" -> "2 m"); the single pass must skip those.
+
+Usage:
+python scripts/bench_comparables.py [num_snippets]
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools_agent.utils.tools.common.utils import extract_price_from_text, calculate_price_per_sqft
+from tools_agent.utils.tools.market.comparables import extract_comparable, format_price_per_sqft
+
+SUBJECT_SQFT = 1800
+
+TEMPLATES = [
+    "Sold for ${price:,} on {month}/{day}/{year}. {beds} beds, {baths} baths, {sqft:,} sq ft single family home.",
+    "{beds} bd | {baths} ba | {sqft:,} sqft - This home last sold on {month_name} {day}, {year} for ${price:,}.",
+    "Beautiful {beds} bedroom, {baths} bathroom home with {sqft:,} square feet. Listed at ${price_k}K. "
+    "Updated kitchen, two-car garage and a large backyard close to schools and parks.",
+    "Price: ${price:,} | {beds}br/{baths}ba | {sqft:,} sf | Closed {month_name} {year}",
+    "Recently renovated home near downtown with {sqft:,} sq. ft. of living space, {beds} beds and "
+    "{baths} baths. Similar homes sold around {price_m} million in {year}.",
+    "View photos and details for this property on our site. Contact the listing agent for more information.",
+    "{beds} bed, {baths} bath home {miles} miles from downtown, on the market for {months} months. "
+    "Listed at ${price_k}K.",
+    "Quiet {beds} bedroom home {miles} minutes from the lake with {sqft:,} sq ft. Call for price.",
+]
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+# One uncompiled search per extra field, as the original helpers are written
+LEGACY_FIELD_PATTERNS = [
+    r'(\d+(?:\.\d+)?)\s*(?:bedrooms?|beds?|bds?|br)\b',
+    r'(\d+(?:\.\d+)?)\s*(?:bathrooms?|baths?|ba)\b',
+    r'(\d[\d,]*)\s*(?:sq\.?\s*f(?:ee)?t\.?|square\s+f(?:ee|oo)t|sf)\b',
+    r'\b(?:sold|closed|on)\s+(?:on\s+)?(\d{1,2}/\d{1,2}/\d{2,4}|[A-Za-z]+\.?\s+(?:\d{1,2},?\s+)?\d{4})',
+]
+
+
+def make_snippets(num_snippets: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    snippets = []
+    for _ in range(num_snippets):
+        price = rng.randrange(150_000, 2_500_000, 1000)
+        snippets.append(rng.choice(TEMPLATES).format(
+            price=price,
+            price_k=price // 1000,
+            price_m=round(price / 1_000_000, 1),
+            beds=rng.randint(1, 6),
+            baths=rng.choice([1, 1.5, 2, 2.5, 3, 4]),
+            sqft=rng.randrange(600, 5000, 10),
+            month=rng.randint(1, 12),
+            month_name=rng.choice(MONTHS),
+            day=rng.randint(1, 28),
+            year=rng.randint(2019, 2025),
+            miles=rng.randint(1, 30),
+            months=rng.randint(1, 12),
+        ))
+    return snippets
+
+
+def legacy_price_only(snippets: list) -> list:
+    out = []
+    for snippet in snippets:
+        price = extract_price_from_text(snippet)
+        out.append((price, calculate_price_per_sqft(price, SUBJECT_SQFT)))
+    return out
+
+
+def legacy_all_fields(snippets: list) -> list:
+    out = []
+    for snippet in snippets:
+        price = extract_price_from_text(snippet)
+        fields = [re.search(pattern, snippet, re.IGNORECASE) for pattern in LEGACY_FIELD_PATTERNS]
+        out.append((price, calculate_price_per_sqft(price, SUBJECT_SQFT), fields))
+    return out
+
+
+def single_pass(snippets: list) -> list:
+    out = []
+    for snippet in snippets:
+        comp = extract_comparable("", "https://www.zillow.com/homedetails/1", snippet)
+        out.append((comp, format_price_per_sqft(comp, SUBJECT_SQFT)))
+    return out
+
+
+def _reads_word_as_scale(snippet: str, legacy_price: str) -> bool:
+    """True when the original price is a number plus the first letter of a longer word."""
+    if legacy_price.startswith("$"):
+        return False
+    end = snippet.find(legacy_price) + len(legacy_price)
+    return legacy_price in snippet and snippet[end:end + 1].isalpha()
+
+
+def timed(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    num_snippets = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    snippets = make_snippets(num_snippets)
+
+    # The single-pass price must agree with the original extractor (it may
+    # additionally keep a trailing "million"/"thousand" the original drops).
+    # Where the original's scale letter starts a longer word ("2 m" from
+    # "2 miles"), the single pass must not report that text as a price.
+    unit_words_skipped = 0
+    for snippet in snippets:
+        legacy = extract_price_from_text(snippet)
+        comp = extract_comparable("", "", snippet)
+        if _reads_word_as_scale(snippet, legacy):
+            unit_words_skipped += 1
+            if comp.price_text == legacy:
+                raise SystemExit(f"❌ Word read as a price in {snippet!r}: {comp.price_text!r}")
+        elif not comp.price_text.startswith(legacy):
+            raise SystemExit(f"❌ Price mismatch for {snippet!r}: {legacy!r} vs {comp.price_text!r}")
+
+    parsed = [extract_comparable("", "", snippet) for snippet in snippets]
+    coverage = {
+        field: sum(getattr(comp, field) is not None for comp in parsed) / len(parsed)
+        for field in ("price", "beds", "baths", "sqft", "sold_date")
+    }
+
+    rows = [
+        ("legacy price + $/sqft", timed(lambda: legacy_price_only(snippets))),
+        ("legacy + per-field searches", timed(lambda: legacy_all_fields(snippets))),
+        ("single-pass extract_comparable", timed(lambda: single_pass(snippets))),
+    ]
+    baseline = rows[1][1]
+
+    print(f"Snippets: {num_snippets:,}\n")
+    print(f"{'extractor':<34}{'total':>12}{'per snippet':>14}{'vs fields':>11}")
+    for name, seconds in rows:
+        print(f"{name:<34}{seconds * 1000:>9.1f} ms{seconds / num_snippets * 1e6:>11.1f} µs"
+              f"{baseline / seconds:>10.1f}x")
+
+    print("\nField coverage: " + ", ".join(f"{field} {share:.0%}" for field, share in coverage.items()))
+    print(f"✅ Single-pass prices agree with extract_price_from_text "
+          f"({unit_words_skipped:,} \"2 miles\"-style misreads skipped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+"""
+Benchmark the common/utils.py text extractors.
+
+Compares the original implementations (pattern lists rebuilt and passed to
+re.findall on every call, reproduced below) against the precompiled
+PatternChain versions on two synthetic workloads:
+1. Professional finder results: name, phone, address and rating per result
+2. CMA results: price and price per square foot per snippet
+
+It also checks that both produce identical output for every input, including
+the ProfessionalCard records built by professionals/cards.py on the finder
+workload.
+
+Usage:
+python scripts/bench_extractors.py [num_results]
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools_agent.utils.tools.common.utils import (
+    calculate_price_per_sqft,
+    extract_address,
+    extract_business_name,
+    extract_phone,
+    extract_price_from_text,
+    extract_prices_batch,
+    extract_professional_details_batch,
+    extract_rating,
+)
+from tools_agent.utils.tools.professionals.cards import extract_cards
+
+SUBJECT_SQFT = 1800
+
+
+# --- Original implementations ------------------------------------------------
+
+def legacy_extract_price_from_text(text):
+    price_patterns = [
+        r'\$[\d,]+(?:\.\d+)?[KkMm]?',
+        r'[\d,]+(?:\.\d+)?[KkMm]?\s*(?:thousand|million|k|m)',
+        r'Listed\s+at\s+\$[\d,]+',
+        r'Sold\s+for\s+\$[\d,]+',
+        r'Price:\s*\$[\d,]+'
+    ]
+    for pattern in price_patterns:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        if matches:
+            return matches[0]
+    return "Price not found"
+
+
+def legacy_calculate_price_per_sqft(price_str, sqft):
+    try:
+        price_match = re.search(r'([\d,]+)', price_str.replace('$', '').replace(',', ''))
+        if price_match and sqft > 0:
+            price = int(price_match.group(1))
+            if 'k' in price_str.lower() or 'thousand' in price_str.lower():
+                price *= 1000
+            elif 'm' in price_str.lower() or 'million' in price_str.lower():
+                price *= 1000000
+            return f"${price / sqft:.0f}/sqft"
+    except Exception:
+        pass
+    return "N/A"
+
+
+def legacy_extract_business_name(title, snippet):
+    title = re.sub(r'^(TOP \d+|Best|Find|Get|Search)\s+', '', title, flags=re.IGNORECASE)
+    title = re.sub(r'\s+(near|in)\s+.*$', '', title, flags=re.IGNORECASE)
+    title = re.sub(r'\s*-\s*.*Yelp.*$', '', title, flags=re.IGNORECASE)
+    title = re.sub(r'\s*-\s*.*Google.*$', '', title, flags=re.IGNORECASE)
+    title = re.sub(r'\s*\|\s*.*$', '', title)
+    if len(title) < 10 or any(word in title.lower() for word in ["photographer", "attorney", "company"]):
+        name_patterns = [
+            r'"([^"]+)"',
+            r'([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Photography|Law|Attorney|Company)',
+            r'Contact\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+is\s+a'
+        ]
+        for pattern in name_patterns:
+            matches = re.findall(pattern, snippet)
+            if matches:
+                return matches[0].strip()
+    return title.strip() if title.strip() else "Professional Service"
+
+
+def legacy_extract_phone(text):
+    phone_patterns = [
+        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+        r'\d{3}[-.\s]\d{3}[-.\s]\d{4}',
+        r'(?:Phone|Call|Tel):?\s*(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+    ]
+    for pattern in phone_patterns:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        if matches:
+            return matches[0].strip()
+    return "📞 Call for info"
+
+
+def legacy_extract_address(text):
+    address_patterns = [
+        r'\d+\s+[A-Za-z0-9\s,\.]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Place|Pl)[A-Za-z0-9\s,\.]*, [A-Z]{2}\s*\d{5}',
+        r'\d+\s+[A-Za-z\s,\.]+, [A-Za-z\s]+, [A-Z]{2}\s*\d{5}',
+        r'(?:Address|Located):?\s*([^\n\r\.]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr)[^\n\r\.]*)'
+    ]
+    for pattern in address_patterns:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        if matches:
+            address = matches[0].strip()
+            return address[:60] + "..." if len(address) > 60 else address
+    return "📍 Address on website"
+
+
+def legacy_extract_rating(text):
+    rating_patterns = [
+        r'(\d+\.?\d*)\s*(?:out of|\/)\s*5\s*stars?',
+        r'(\d+\.?\d*)\s*stars?',
+        r'Rating:?\s*(\d+\.?\d*)',
+        r'(\d+\.?\d*)\/5',
+        r'Rated\s+(\d+\.?\d*)'
+    ]
+    for pattern in rating_patterns:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        if matches:
+            rating = float(matches[0])
+            return f"{'⭐' * int(rating)}{'☆' * (5 - int(rating))} ({rating}/5)"
+    return "⭐ Not rated yet"
+
+
+# --- Synthetic workloads -----------------------------------------------------
+
+FIRST = ["Maria", "James", "Aisha", "Chen", "Robert", "Priya", "Diego", "Hannah"]
+LAST = ["Lopez", "Carter", "Nguyen", "Okafor", "Schmidt", "Patel", "Rivera", "Brooks"]
+STREETS = ["Congress Ave", "Lamar Blvd", "Main Street", "Oak Drive", "Burnet Road", "Elm Lane"]
+CITIES = [("Austin", "TX", 78701), ("Denver", "CO", 80202), ("Tampa", "FL", 33602)]
+PROFESSIONS = ["Law", "Photography", "Attorney", "Company"]
+
+FINDER_TITLES = [
+    "{first} {last} {profession} - {city}, {state} - Yelp",
+    "Best real estate attorney near {city}",
+    "{first} {last} | Real Estate Photographer",
+    "{first}'s {profession} Group",
+    "Company",
+]
+FINDER_SNIPPETS = [
+    "{first} {last} {profession} is a trusted local firm. Call ({area}) {mid}-{end} or visit us at "
+    "{num} {street}, {city}, {state} {zip}. Rated {rating} by 120 clients.",
+    "\"{first} {last} {profession}\" serves {city} and surrounding areas. {rating} out of 5 stars on Google. "
+    "Phone: {area}.{mid}.{end}",
+    "Contact {first} {last} for a free consultation about closings, title review and contracts in {city}.",
+    "Top rated team with {rating} stars. Located at {num} {street} in downtown {city}. Open weekdays 9-5.",
+    "Professional services for home sellers. Flexible scheduling, fast turnaround and competitive pricing "
+    "for listings of every size across the metro area.",
+]
+CMA_SNIPPETS = [
+    "Sold for ${price:,} on {month}/{day}/2024. {beds} beds, {baths} baths, {sqft:,} sq ft.",
+    "{beds} bd | {baths} ba | {sqft:,} sqft - This home last sold for ${price:,}.",
+    "Listed at ${price_k}K. Updated kitchen, {beds} bedrooms and a large backyard close to schools.",
+    "Similar homes in the area sold around {price_m} million last year according to local agents.",
+    "View photos and details for this property. Contact the listing agent for more information.",
+]
+
+
+def make_finder_results(num_results, seed=0):
+    rng = random.Random(seed)
+    results = []
+    for _ in range(num_results):
+        city, state, zip_code = rng.choice(CITIES)
+        fields = dict(
+            first=rng.choice(FIRST), last=rng.choice(LAST), profession=rng.choice(PROFESSIONS),
+            city=city, state=state, zip=zip_code, street=rng.choice(STREETS), num=rng.randint(10, 9999),
+            area=rng.randint(200, 999), mid=rng.randint(200, 999), end=rng.randint(1000, 9999),
+            rating=round(rng.uniform(3.0, 5.0), 1),
+        )
+        results.append({
+            "title": rng.choice(FINDER_TITLES).format(**fields),
+            "snippet": rng.choice(FINDER_SNIPPETS).format(**fields),
+        })
+    return results
+
+
+def make_cma_snippets(num_results, seed=0):
+    rng = random.Random(seed)
+    snippets = []
+    for _ in range(num_results):
+        price = rng.randrange(150_000, 2_500_000, 1000)
+        snippets.append(rng.choice(CMA_SNIPPETS).format(
+            price=price, price_k=price // 1000, price_m=round(price / 1_000_000, 1),
+            month=rng.randint(1, 12), day=rng.randint(1, 28), beds=rng.randint(1, 6),
+            baths=rng.choice([1, 1.5, 2, 2.5, 3]), sqft=rng.randrange(600, 5000, 10),
+        ))
+    return snippets
+
+
+# --- Runners -----------------------------------------------------------------
+
+def legacy_finder(results):
+    return [
+        {
+            "name": legacy_extract_business_name(item["title"], item["snippet"]),
+            "phone": legacy_extract_phone(item["snippet"]),
+            "address": legacy_extract_address(item["snippet"]),
+            "rating": legacy_extract_rating(item["snippet"]),
+        }
+        for item in results
+    ]
+
+
+def compiled_finder(results):
+    return [
+        {
+            "name": extract_business_name(item["title"], item["snippet"]),
+            "phone": extract_phone(item["snippet"]),
+            "address": extract_address(item["snippet"]),
+            "rating": extract_rating(item["snippet"]),
+        }
+        for item in results
+    ]
+
+
+def legacy_cma(snippets):
+    out = []
+    for snippet in snippets:
+        price = legacy_extract_price_from_text(snippet)
+        out.append((price, legacy_calculate_price_per_sqft(price, SUBJECT_SQFT)))
+    return out
+
+
+def compiled_cma(snippets):
+    out = []
+    for snippet in snippets:
+        price = extract_price_from_text(snippet)
+        out.append((price, calculate_price_per_sqft(price, SUBJECT_SQFT)))
+    return out
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    num_results = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    finder_results = make_finder_results(num_results)
+    cma_snippets = make_cma_snippets(num_results)
+
+    if legacy_finder(finder_results) != extract_professional_details_batch(finder_results):
+        raise SystemExit("❌ Finder extraction mismatch")
+    if legacy_cma(cma_snippets) != extract_prices_batch(cma_snippets, SUBJECT_SQFT):
+        raise SystemExit("❌ CMA extraction mismatch")
+
+    workloads = [
+        ("finder (name/phone/address/rating)", finder_results,
+         legacy_finder, compiled_finder, extract_professional_details_batch),
+        ("CMA (price, $/sqft)", cma_snippets,
+         legacy_cma, compiled_cma, lambda snippets: extract_prices_batch(snippets, SUBJECT_SQFT)),
+    ]
+
+    print(f"Results per workload: {num_results:,}\n")
+    print(f"{'workload':<38}{'legacy':>11}{'compiled':>11}{'batch':>11}{'speedup':>9}")
+    for name, data, legacy, compiled, batch in workloads:
+        legacy_time = timed(lambda: legacy(data))
+        compiled_time = timed(lambda: compiled(data))
+        batch_time = timed(lambda: batch(data))
+        print(f"{name:<38}{legacy_time * 1000:>8.1f} ms{compiled_time * 1000:>8.1f} ms"
+              f"{batch_time * 1000:>8.1f} ms{legacy_time / min(compiled_time, batch_time):>8.1f}x")
+
+    legacy_cards = legacy_finder(finder_results)
+    cards = extract_cards(finder_results)
+    for field in ("name", "phone", "address", "rating"):
+        if [card[field] for card in legacy_cards] != [card[field] for card in cards]:
+            raise SystemExit(f"❌ Professional card {field} mismatch")
+    legacy_time = timed(lambda: legacy_finder(finder_results))
+    cards_time = timed(lambda: extract_cards(finder_results))
+    print(f"{'finder, ProfessionalCard records':<38}{legacy_time * 1000:>8.1f} ms{'':>11}"
+          f"{cards_time * 1000:>8.1f} ms{legacy_time / cards_time:>8.1f}x")
+
+    print("\n✅ Compiled extractors and professional cards match the originals on every input")
+
+if __name__ == "__main__":
+    main()
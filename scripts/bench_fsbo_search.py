@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Benchmark partial-match scoring for the FSBO knowledge base.
+
+Builds a synthetic 10k-chunk corpus and compares:
+1. The original per-chunk loop (`any(word in chunk_word for chunk_word in chunk.split())`)
+2. InvertedIndex.partial_match_counts (n-gram index + set intersections)
+
+It also checks that both produce identical per-chunk partial scores. The
+corpus and queries include punctuation, capitals and repeated query words,
+all of which the original loop treats specially.
+
+Usage:
+python scripts/bench_fsbo_search.py [num_chunks]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools_agent.utils.tools.integrations.search_index import PARTIAL_MATCH_WEIGHT, InvertedIndex
+
+SYLLABLES = ["pri", "ce", "clo", "sing", "cost", "home", "sel", "ler", "of", "fer",
+             "ti", "tle", "in", "spec", "tion", "ap", "prai", "sal", "mar", "ket"]
+
+# Chunk words get punctuation and capitals attached the way real prose does
+DECORATIONS = ["{}", "{}", "{}", "{},", "{}.", "({})", "{}'s", "{}?", "{}-{}"]
+
+QUERIES = [
+    "how do I price my home",
+    "closing costs",
+    "title inspection appraisal",
+    "pric",
+    "seller offer market",
+    "Price, price and PRICE?",
+    "closing costs costs",
+    "seller's (offer)",
+    "home-sel ti.",
+]
+
+
+def make_corpus(num_chunks: int, words_per_chunk: int = 90, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))) for _ in range(5000)]
+
+    def word():
+        text = rng.choice(DECORATIONS).format(rng.choice(vocab), rng.choice(vocab))
+        return text.capitalize() if rng.random() < 0.1 else text
+
+    return [" ".join(word() for _ in range(words_per_chunk)) for _ in range(num_chunks)]
+
+
+def legacy_partial_scores(chunks: list, query: str) -> dict:
+    """The original per-chunk partial-match loop from FSBORAG.search, verbatim."""
+    query_words = query.lower().split()
+    scores = {}
+    for i, chunk in enumerate(chunks):
+        chunk_lower = chunk.lower()
+        partial_matches = sum(0.5 for word in query_words 
+                            if any(word in chunk_word for chunk_word in chunk_lower.split()))
+        if partial_matches:
+            scores[i] = partial_matches
+    return scores
+
+
+def index_partial_scores(index: InvertedIndex, query: str) -> dict:
+    counts = index.partial_match_counts(query.lower().split())
+    return {doc_id: PARTIAL_MATCH_WEIGHT * count for doc_id, count in counts.items()}
+
+
+def timed(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    num_chunks = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    chunks = make_corpus(num_chunks)
+
+    start = time.perf_counter()
+    index = InvertedIndex(chunks)
+    build_time = time.perf_counter() - start
+
+    print(f"Corpus: {num_chunks:,} chunks, {len(index.postings):,} distinct terms")
+    print(f"Index build: {build_time * 1000:.1f} ms\n")
+    print(f"{'query':<32}{'legacy loop':>14}{'n-gram index':>14}{'speedup':>10}")
+
+    for query in QUERIES:
+        expected = legacy_partial_scores(chunks, query)
+        actual = index_partial_scores(index, query)
+        if expected != actual:
+            raise SystemExit(f"❌ Score mismatch for query {query!r}")
+
+        legacy_time = timed(lambda: legacy_partial_scores(chunks, query), repeat=1)
+        index_time = timed(lambda: index_partial_scores(index, query))
+        print(f"{query:<32}{legacy_time * 1000:>11.1f} ms{index_time * 1000:>11.2f} ms"
+              f"{legacy_time / index_time:>9.0f}x")
+
+    print("\n✅ Partial-match scores identical for all queries")
+
+
+if __name__ == "__main__":
+    main()
@@ -200,18 +200,19 @@
 
 # tools_agent/agent.py - Testing with ONLY listing tools
 
+import os
+import json
+import hashlib
+import logging
 from langchain_core.runnables import RunnableConfig
 from typing import Optional
 from pydantic import BaseModel, Field
 from langgraph.prebuilt import create_react_agent
-from langchain.chat_models import init_chat_model
+from tools_agent.utils.cache import TTLCache
+from tools_agent.utils.models import get_chat_model
 
 # Import ONLY listing tools to test
-from tools_agent.utils.tools.listing.creation import (
-    create_property_listing,
-    update_property_listing,
-    get_my_listings,
-)
+from tools_agent.utils.tools.listing.creation import ASYNC_LISTING_TOOLS
 
 UNEDITABLE_SYSTEM_PROMPT = "\nIf the tool throws an error requiring authentication, provide the user with a Markdown link to the authentication page and prompt them to authenticate."
 
@@ -228,25 +229,67 @@ class GraphConfigPydantic(BaseModel):
     max_tokens: Optional[int] = Field(default=4000)
     system_prompt: Optional[str] = Field(default=DEFAULT_SYSTEM_PROMPT)
 
+logger = logging.getLogger(__name__)
+
+# Compiled agents are stateless (thread state lives in the checkpointer), so one
+# compiled graph can serve every run that shares the same config and tool set.
+_agent_cache = TTLCache(
+    maxsize=int(os.getenv("AGENT_CACHE_MAXSIZE", "32")),
+    ttl=float(os.getenv("AGENT_CACHE_TTL", "3600")),
+)
+
+
+def _tool_name(tool) -> str:
+    """Return a stable identifier for a tool object or plain function."""
+    name = getattr(tool, "name", None) or getattr(tool, "__name__", None) or repr(tool)
+    module = getattr(tool, "__module__", "")
+    return f"{module}.{name}" if module else name
+
+
+def _agent_cache_key(cfg: GraphConfigPydantic, tools: list) -> str:
+    """Hash the graph config fields and the resolved tool set into a cache key."""
+    payload = {
+        "config": cfg.model_dump(mode="json"),
+        "tools": sorted(_tool_name(tool) for tool in tools),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def get_agent_cache_stats() -> dict:
+    """Return hit/miss counters for the compiled agent cache."""
+    return _agent_cache.stats()
+
+
+def clear_agent_cache() -> None:
+    """Drop every compiled agent, e.g. after tool code is reloaded."""
+    _agent_cache.clear()
+
+
 async def graph(config: RunnableConfig):
     cfg = GraphConfigPydantic(**config.get("configurable", {}))
     
     # Start with ONLY listing tools
-    tools = [
-        create_property_listing,
-        update_property_listing,
-        get_my_listings,
-    ]
+    # Native async listing tools: backend calls are awaited on the server's loop
+    tools = list(ASYNC_LISTING_TOOLS)
+
+    cache_key = _agent_cache_key(cfg, tools)
+    agent = _agent_cache.get(cache_key)
+    if agent is not None:
+        return agent
 
-    model = init_chat_model(
+    model = get_chat_model(
         cfg.model_name,
         temperature=cfg.temperature,
         max_tokens=cfg.max_tokens,
     )
 
-    return create_react_agent(
+    agent = create_react_agent(
         prompt=cfg.system_prompt + UNEDITABLE_SYSTEM_PROMPT,
         model=model,
         tools=tools,
         config_schema=GraphConfigPydantic,
-    )
\ No newline at end of file
+    )
+    _agent_cache.set(cache_key, agent)
+    logger.info(f"Compiled new agent ({len(tools)} tools); cache stats: {_agent_cache.stats()}")
+    return agent
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Custom HTTP app mounted by the LangGraph server (langgraph.json "http.app").
+
+It adds no routes of its own. Its lifespan closes the process-wide connection
+pools (model HTTP clients, Tavily sessions, listing backend clients) when the
+server shuts down, so keep-alive sockets are released instead of being left
+to the garbage collector.
+"""
+import logging
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+
+from tools_agent.utils.models import aclose_model_clients
+from tools_agent.utils.tools.common.tavily import aclose_tavily_client
+from tools_agent.utils.tools.listing.client import aclose_listing_client
+
+logger = logging.getLogger(__name__)
+
+_SHUTDOWN_HOOKS = (aclose_model_clients, aclose_tavily_client, aclose_listing_client)
+
+
+async def aclose_shared_clients():
+    """Run every shutdown hook; one failing hook does not keep the others from closing."""
+    for hook in _SHUTDOWN_HOOKS:
+        try:
+            await hook()
+        except Exception as e:
+            logger.warning(f"{hook.__name__} failed during shutdown: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    yield
+    await aclose_shared_clients()
+
+
+app = Starlette(lifespan=lifespan)
@@ -0,0 +1,224 @@
+"""
+Process-wide registry of chat-model clients with shared keep-alive HTTP pools.
+"""
+import os
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+from langchain.chat_models import init_chat_model
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits shared by every pooled model client
+MODEL_POOL_MAX_CONNECTIONS = int(os.getenv("MODEL_POOL_MAX_CONNECTIONS", "100"))
+MODEL_POOL_MAX_KEEPALIVE = int(os.getenv("MODEL_POOL_MAX_KEEPALIVE", "20"))
+MODEL_POOL_KEEPALIVE_EXPIRY = float(os.getenv("MODEL_POOL_KEEPALIVE_EXPIRY", "60"))
+MODEL_POOL_TIMEOUT = float(os.getenv("MODEL_POOL_TIMEOUT", "120"))
+
+# Providers whose LangChain integration accepts injected httpx clients
+_HTTPX_PROVIDERS = {"openai", "azure_openai"}
+
+ModelKey = Tuple[str, Optional[float], Optional[int]]
+MetricsHook = Callable[[str, Dict[str, Any]], None]
+
+_models: Dict[ModelKey, Any] = {}
+_lock = threading.Lock()
+_metrics_lock = threading.Lock()
+_http_clients: Dict[str, Any] = {}
+_metrics_hook: Optional[MetricsHook] = None
+_metrics = {
+    "models_created": 0,
+    "models_reused": 0,
+    "http_requests": 0,
+    "connections_opened": 0,
+}
+
+
+def set_model_metrics_hook(hook: Optional[MetricsHook]) -> None:
+    """
+    Register a callback for model registry and connection events.
+
+    The hook is called as `hook(event, info)` where event is one of
+    "model_created", "model_reused", "http_request" or "connection_opened".
+    Pass None to remove it.
+    """
+    global _metrics_hook
+    _metrics_hook = hook
+
+
+def get_model_metrics() -> Dict[str, Any]:
+    """Return registry counters, including how many requests reused a pooled connection."""
+    with _metrics_lock:
+        metrics = dict(_metrics)
+    metrics["connections_reused"] = max(metrics["http_requests"] - metrics["connections_opened"], 0)
+    metrics["pooled_models"] = len(_models)
+    return metrics
+
+
+def _emit(event: str, **info: Any) -> None:
+    counter = {
+        "model_created": "models_created",
+        "model_reused": "models_reused",
+        "http_request": "http_requests",
+        "connection_opened": "connections_opened",
+    }[event]
+    with _metrics_lock:
+        _metrics[counter] += 1
+    if _metrics_hook is not None:
+        try:
+            _metrics_hook(event, info)
+        except Exception as e:
+            logger.warning(f"Model metrics hook failed: {e}")
+
+
+def _trace(name: str, info: Dict[str, Any]) -> None:
+    if name == "connection.connect_tcp.complete":
+        _emit("connection_opened")
+
+
+async def _atrace(name: str, info: Dict[str, Any]) -> None:
+    _trace(name, info)
+
+
+def _on_request(request: httpx.Request) -> None:
+    request.extensions["trace"] = _trace
+    _emit("http_request", host=request.url.host)
+
+
+async def _on_async_request(request: httpx.Request) -> None:
+    request.extensions["trace"] = _atrace
+    _emit("http_request", host=request.url.host)
+
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=MODEL_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=MODEL_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=MODEL_POOL_KEEPALIVE_EXPIRY,
+    )
+
+
+def _pool_timeout() -> httpx.Timeout:
+    return httpx.Timeout(MODEL_POOL_TIMEOUT, connect=10.0)
+
+
+class _LoopPooledAsyncClient(httpx.AsyncClient):
+    """
+    The async client handed to every pooled model.
+
+    Models live for the whole process, but an httpx.AsyncClient's connections
+    belong to the event loop that opened them. This client keeps one real
+    pool per running loop and sends each request through the caller's, so a
+    model keeps working across asyncio.run() calls and worker-thread loops.
+    Pools of loops that have been closed are dropped.
+    """
+
+    def __init__(self):
+        super().__init__(timeout=_pool_timeout())
+        self._pools: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._pools_lock = threading.Lock()
+
+    def _pool(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None or pool.is_closed:
+            with self._pools_lock:
+                for old_loop in [old for old in self._pools if old.is_closed()]:
+                    del self._pools[old_loop]
+                pool = self._pools[loop] = httpx.AsyncClient(
+                    limits=_pool_limits(),
+                    timeout=_pool_timeout(),
+                    event_hooks={"request": [_on_async_request]},
+                )
+        return pool
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        return await self._pool().send(request, **kwargs)
+
+    async def aclose(self) -> None:
+        """
+        Close every loop's pool on its own loop: directly for the caller's
+        loop, via run_coroutine_threadsafe for loops running on other threads.
+        """
+        current = asyncio.get_running_loop()
+        with self._pools_lock:
+            pools, self._pools = self._pools, {}
+        for loop, pool in pools.items():
+            if pool.is_closed:
+                continue
+            if loop is current:
+                await pool.aclose()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(pool.aclose(), loop))
+        await super().aclose()
+
+
+def _get_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """Return the shared sync/async httpx clients, creating them on first use."""
+    if "sync" not in _http_clients:
+        _http_clients["sync"] = httpx.Client(
+            limits=_pool_limits(),
+            timeout=_pool_timeout(),
+            event_hooks={"request": [_on_request]},
+        )
+        _http_clients["async"] = _LoopPooledAsyncClient()
+    return _http_clients["sync"], _http_clients["async"]
+
+
+def _provider(model_name: str) -> str:
+    if ":" in model_name:
+        return model_name.split(":", 1)[0]
+    return "openai" if model_name.startswith(("gpt-", "o1", "o3", "o4")) else ""
+
+
+def get_chat_model(
+    model_name: str,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+):
+    """
+    Return a shared chat model for the given settings.
+
+    Models are keyed on (model_name, temperature, max_tokens) and live for the
+    whole process, so their provider SDK clients and keep-alive connections are
+    reused across runs and threads instead of being rebuilt per `graph()` call.
+    OpenAI-compatible providers additionally share pooled httpx clients (one
+    sync pool, plus one async pool per event loop).
+    """
+    key: ModelKey = (model_name, temperature, max_tokens)
+    model = _models.get(key)
+    if model is not None:
+        _emit("model_reused", model=model_name)
+        return model
+
+    with _lock:
+        model = _models.get(key)
+        if model is not None:
+            _emit("model_reused", model=model_name)
+            return model
+
+        kwargs: Dict[str, Any] = {"temperature": temperature, "max_tokens": max_tokens}
+        if _provider(model_name) in _HTTPX_PROVIDERS:
+            http_client, http_async_client = _get_http_clients()
+            kwargs["http_client"] = http_client
+            kwargs["http_async_client"] = http_async_client
+
+        model = init_chat_model(model_name, **kwargs)
+        _models[key] = model
+        _emit("model_created", model=model_name)
+        return model
+
+
+async def aclose_model_clients() -> None:
+    """Close the shared HTTP pools (every loop's async pool) and drop every registered model (for shutdown)."""
+    with _lock:
+        _models.clear()
+        clients = dict(_http_clients)
+        _http_clients.clear()
+    if "sync" in clients:
+        clients["sync"].close()
+    if "async" in clients:
+        await clients["async"].aclose()
@@ -6,7 +6,10 @@ from .finance_legal import *
 from .integrations import *
 
 # Import the listing tools with correct names
-from .listing.creation import create_property_listing, update_property_listing, get_my_listings
+from .listing.creation import (
+    create_property_listing, update_property_listing, get_my_listings,
+    acreate_property_listing, aupdate_property_listing, aget_my_listings,
+)
 
 # Import market tools
 from .market import neighborhood_activity_tracker, market_trends
@@ -39,7 +42,8 @@ try:
         find_title_company,
         find_appraiser,
         find_real_estate_photographer,
-        find_home_inspector
+        find_home_inspector,
+        find_closing_team
     )
 except ImportError:
     # Define placeholder functions if they don't exist yet
@@ -49,6 +53,7 @@ except ImportError:
     def find_appraiser(): pass
     def find_real_estate_photographer(): pass
     def find_home_inspector(): pass
+    def find_closing_team(): pass
 
 # Import scheduling and social media tools
 try:
@@ -73,6 +78,9 @@ __all__ = [
     "create_property_listing", 
     "update_property_listing",
     "get_my_listings",
+    "acreate_property_listing",
+    "aupdate_property_listing",
+    "aget_my_listings",
     
     # Market tools
     "market_trends",
@@ -89,6 +97,7 @@ __all__ = [
     "find_appraiser",
     "find_real_estate_photographer",
     "find_home_inspector",
+    "find_closing_team",
     
     # Marketing and scheduling tools
     "schedule_open_house",
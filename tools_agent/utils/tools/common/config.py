@@ -9,6 +9,49 @@ load_dotenv()
 
 # API Keys and Configuration
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
+
+# Tavily HTTP client tuning
+TAVILY_MAX_CONNECTIONS = int(os.getenv("TAVILY_MAX_CONNECTIONS", "20"))
+TAVILY_KEEPALIVE_TIMEOUT = float(os.getenv("TAVILY_KEEPALIVE_TIMEOUT", "60"))
+TAVILY_CONNECT_TIMEOUT = float(os.getenv("TAVILY_CONNECT_TIMEOUT", "10"))
+TAVILY_REQUEST_TIMEOUT = float(os.getenv("TAVILY_REQUEST_TIMEOUT", "30"))
+
+# Tavily rate limiting: requests/second, burst size, max concurrent requests, retries on 429/503
+TAVILY_RATE_LIMIT = float(os.getenv("TAVILY_RATE_LIMIT", "5"))
+TAVILY_BURST = float(os.getenv("TAVILY_BURST", "10"))
+TAVILY_MAX_CONCURRENCY = int(os.getenv("TAVILY_MAX_CONCURRENCY", "8"))
+TAVILY_MAX_RETRIES = int(os.getenv("TAVILY_MAX_RETRIES", "3"))
+
+# Tavily response cache: fresh TTL per tool, extra stale window, and optional SQLite file
+TAVILY_CACHE_TTL_MARKET_TRENDS = float(os.getenv("TAVILY_CACHE_TTL_MARKET_TRENDS", "3600"))
+TAVILY_CACHE_TTL_PROPERTY_DATA = float(os.getenv("TAVILY_CACHE_TTL_PROPERTY_DATA", "900"))
+TAVILY_CACHE_TTL_PROFESSIONALS = float(os.getenv("TAVILY_CACHE_TTL_PROFESSIONALS", "86400"))
+TAVILY_CACHE_STALE_TTL = float(os.getenv("TAVILY_CACHE_STALE_TTL", "3600"))
+TAVILY_CACHE_SIZE = int(os.getenv("TAVILY_CACHE_SIZE", "512"))
+TAVILY_CACHE_DB = os.getenv("TAVILY_CACHE_DB")
+
+# Local directory of professionals from past searches (SQLite + FTS5); unset disables it.
+# Entries older than the refresh interval are re-searched in the background; businesses
+# not seen by any search within the max age are dropped
+PROFESSIONAL_DIRECTORY_DB = os.getenv("PROFESSIONAL_DIRECTORY_DB")
+PROFESSIONAL_DIRECTORY_REFRESH = float(os.getenv("PROFESSIONAL_DIRECTORY_REFRESH", "604800"))
+PROFESSIONAL_DIRECTORY_MAX_AGE = float(os.getenv("PROFESSIONAL_DIRECTORY_MAX_AGE", "2592000"))
+
+# FastAPI listing backend: base URL, keep-alive pool size and expiry, timeouts (seconds)
+LISTING_API_BASE_URL = os.getenv("BASE_URL", "https://vesty-app-fastapi.onrender.com")
+LISTING_API_MAX_CONNECTIONS = int(os.getenv("LISTING_API_MAX_CONNECTIONS", "10"))
+LISTING_API_KEEPALIVE_EXPIRY = float(os.getenv("LISTING_API_KEEPALIVE_EXPIRY", "60"))
+LISTING_API_CONNECT_TIMEOUT = float(os.getenv("LISTING_API_CONNECT_TIMEOUT", "15"))
+LISTING_API_READ_TIMEOUT = float(os.getenv("LISTING_API_READ_TIMEOUT", "30"))
+LISTING_API_POOL_TIMEOUT = float(os.getenv("LISTING_API_POOL_TIMEOUT", "30"))
+
+# Batch CMA generation: max distinct property searches in flight at once
+CMA_BATCH_CONCURRENCY = int(os.getenv("CMA_BATCH_CONCURRENCY", "8"))
+
+# Optional local JSON of comparable search results; when set, quick_property_valuation
+# values against it instead of searching (reproducible, offline)
+VALUATION_COMPS_FILE = os.getenv("VALUATION_COMPS_FILE")
+
 AZURE_ENDPOINT = os.getenv("AZURE_CV_ENDPOINT")
 AZURE_KEY = os.getenv("AZURE_CV_KEY")
 
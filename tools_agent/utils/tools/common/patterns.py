@@ -0,0 +1,120 @@
+"""
+Precompiled regex library for the text extractors in common/utils.py.
+
+Each extractor is a PatternChain: an ordered list of compiled rules where the
+first rule (in list order) that matches anywhere wins, exactly like looping
+re.findall over a pattern list and taking matches[0]. Rules carry cheap guards
+(substrings, or a small regex every match must contain) so a snippet that
+cannot match is rejected without running the full pattern, and the chain
+stops at the first hit. Patterns already covered by an earlier, more general
+one (e.g. "Sold for $450,000" is found by the plain "$450,000" rule) are
+folded into it.
+"""
+import re
+from typing import NamedTuple, Optional, Pattern, Sequence, Tuple
+
+
+class Rule(NamedTuple):
+    regex: Pattern
+    # findall returns group 1 for single-group patterns, else the whole match
+    group: int = 0
+    # Casefolded substrings; at least one must occur for the regex to match
+    needles: Tuple[str, ...] = ()
+    # A regex every match must contain; checked before the full pattern
+    guard: Optional[Pattern] = None
+
+
+def rule(pattern: str, flags: int = 0, needles: Sequence[str] = (), guard: Optional[Pattern] = None) -> Rule:
+    """Compile `pattern` into a Rule with findall's group semantics."""
+    regex = re.compile(pattern, flags)
+    return Rule(regex, 1 if regex.groups == 1 else 0, tuple(n.casefold() for n in needles), guard)
+
+
+class PatternChain:
+    """Ordered rules; first() returns the first rule's leftmost match, or None."""
+
+    def __init__(self, *rules: Rule):
+        self.rules = rules
+
+    def first(self, text: str) -> Optional[str]:
+        folded = None
+        guards = {}
+        for r in self.rules:
+            if r.needles:
+                if folded is None:
+                    folded = text.casefold()
+                if not any(needle in folded for needle in r.needles):
+                    continue
+            if r.guard is not None:
+                if r.guard not in guards:
+                    guards[r.guard] = r.guard.search(text) is not None
+                if not guards[r.guard]:
+                    continue
+            match = r.regex.search(text)
+            if match:
+                return match.group(r.group)
+        return None
+
+
+# "Listed at $X", "Sold for $X" and "Price: $X" all contain a "$X" match at
+# or before the same position, so the plain "$" rule covers them
+PRICE = PatternChain(
+    rule(r'\$[\d,]+(?:\.\d+)?[KkMm]?', needles=("$",)),
+    # Only start at the beginning of a digit run and never give digits back:
+    # a match starting mid-run always has one starting at the run's start,
+    # and no later element can match a digit or comma
+    rule(r'(?<![\d,])[\d,]++(?:\.\d++)?[KkMm]?\s*(?:thousand|million|k|m)', re.IGNORECASE, needles=("k", "m", "thousand")),
+)
+
+# The separator-required and "Phone:"-prefixed forms are both matched by the
+# general pattern at or before the same position
+PHONE = PatternChain(
+    rule(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+)
+
+# Both street-address forms end in ", ST 12345"
+_ZIP_GUARD = re.compile(r', [A-Z]{2}\s*\d{5}', re.IGNORECASE)
+ADDRESS = PatternChain(
+    rule(
+        r'\d+\s+[A-Za-z0-9\s,\.]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Place|Pl)'
+        r'[A-Za-z0-9\s,\.]*, [A-Z]{2}\s*\d{5}',
+        re.IGNORECASE,
+        guard=_ZIP_GUARD,
+    ),
+    rule(r'\d+\s+[A-Za-z\s,\.]+, [A-Za-z\s]+, [A-Z]{2}\s*\d{5}', re.IGNORECASE, guard=_ZIP_GUARD),
+    rule(
+        r'(?:Address|Located):?\s*([^\n\r\.]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr)[^\n\r\.]*)',
+        re.IGNORECASE,
+        needles=("address", "located"),
+    ),
+)
+
+RATING = PatternChain(
+    rule(r'(\d+\.?\d*)\s*(?:out of|\/)\s*5\s*stars?', re.IGNORECASE, needles=("star",)),
+    rule(r'(\d+\.?\d*)\s*stars?', re.IGNORECASE, needles=("star",)),
+    rule(r'Rating:?\s*(\d+\.?\d*)', re.IGNORECASE, needles=("rating",)),
+    rule(r'(\d+\.?\d*)\/5', re.IGNORECASE, needles=("/5",)),
+    rule(r'Rated\s+(\d+\.?\d*)', re.IGNORECASE, needles=("rated",)),
+)
+
+BUSINESS_NAME = PatternChain(
+    rule(r'"([^"]+)"', needles=('"',)),
+    rule(
+        r'([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Photography|Law|Attorney|Company)',
+        needles=("photography", "law", "attorney", "company"),
+    ),
+    rule(r'Contact\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', needles=("contact",)),
+    rule(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+is\s+a', needles=("is",)),
+)
+
+# Title clean-up, applied in order by extract_business_name
+TITLE_CLEANUP = (
+    (re.compile(r'^(TOP \d+|Best|Find|Get|Search)\s+', re.IGNORECASE), ''),
+    (re.compile(r'\s+(near|in)\s+.*$', re.IGNORECASE), ''),
+    (re.compile(r'\s*-\s*.*Yelp.*$', re.IGNORECASE), ''),
+    (re.compile(r'\s*-\s*.*Google.*$', re.IGNORECASE), ''),
+    (re.compile(r'\s*\|\s*.*$'), ''),
+)
+
+PRICE_DIGITS = re.compile(r'([\d,]+)')
+NON_NUMERIC = re.compile(r'[^\d.]')
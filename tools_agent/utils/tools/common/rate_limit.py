@@ -0,0 +1,138 @@
+"""
+Rate limiting and concurrency control for outbound search APIs.
+"""
+import asyncio
+import random
+import time
+from collections import OrderedDict, deque
+from email.utils import parsedate_to_datetime
+from typing import Deque, Optional
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_take(self) -> float:
+        """Take one token and return 0, or return the seconds until one is available."""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.rate <= 0:
+            return 0.0
+        self._refill(now)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for `seconds` (e.g. after the server sent Retry-After)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        # Start refilling only once the pause is over
+        self._updated = self._paused_until
+
+
+class FairGovernor:
+    """
+    Admit at most `max_concurrency` requests at once, paced by a token bucket.
+
+    Waiters are queued per owner and admitted round-robin across owners, so one
+    user firing a burst (e.g. generate_cma's four parallel searches) cannot
+    starve everyone else's requests.
+    """
+
+    def __init__(self, max_concurrency: int, rate: float, burst: float):
+        self.max_concurrency = max_concurrency
+        self.bucket = TokenBucket(rate, burst)
+        self._queues: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._active = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    async def acquire(self, owner: str):
+        """Wait for a slot; must be paired with release()."""
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(owner, deque()).append(waiter)
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted just as we were cancelled; hand it back
+                self.release()
+            raise
+
+    def release(self):
+        self._active -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._active < self.max_concurrency and self._queues:
+            owner, queue = next(iter(self._queues.items()))
+            while queue and queue[0].done():
+                queue.popleft()
+            if not queue:
+                del self._queues[owner]
+                continue
+
+            wait = self.bucket.try_take()
+            if wait > 0:
+                self._schedule(wait)
+                return
+
+            waiter = queue.popleft()
+            # Rotate this owner to the back of the line
+            del self._queues[owner]
+            if queue:
+                self._queues[owner] = queue
+            self._active += 1
+            waiter.set_result(None)
+
+    def _schedule(self, delay: float):
+        if self._timer is not None and not self._timer.cancelled():
+            return
+        loop = asyncio.get_running_loop()
+
+        def fire():
+            self._timer = None
+            self._dispatch()
+
+        self._timer = loop.call_later(delay, fire)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff with full jitter for retry `attempt` (0-based)."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
@@ -0,0 +1,293 @@
+"""
+Shared Tavily search client with a long-lived, keep-alive aiohttp session.
+"""
+import asyncio
+import logging
+import aiohttp
+from typing import Any, Dict, Optional, Tuple
+from langchain_core.tools import ToolException
+from langchain_core.runnables.config import var_child_runnable_config
+from .config import (
+    TAVILY_API_KEY,
+    TAVILY_MAX_CONNECTIONS,
+    TAVILY_KEEPALIVE_TIMEOUT,
+    TAVILY_CONNECT_TIMEOUT,
+    TAVILY_REQUEST_TIMEOUT,
+    TAVILY_RATE_LIMIT,
+    TAVILY_BURST,
+    TAVILY_MAX_CONCURRENCY,
+    TAVILY_MAX_RETRIES,
+    TAVILY_CACHE_SIZE,
+    TAVILY_CACHE_STALE_TTL,
+    TAVILY_CACHE_DB,
+    validate_tavily_api,
+)
+from .tavily_cache import FRESH, STALE, TavilyResponseCache, payload_key
+from .rate_limit import FairGovernor, backoff_delay, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+# Statuses worth retrying after backing off
+_RETRYABLE_STATUSES = {429, 503}
+
+
+def current_owner() -> str:
+    """Return the LangGraph user (metadata.owner) of the run we are executing in, if any."""
+    config = var_child_runnable_config.get() or {}
+    return (
+        (config.get("metadata") or {}).get("owner")
+        or (config.get("configurable") or {}).get("langgraph_auth_user_id")
+        or "anonymous"
+    )
+
+
+class TavilyAPIError(ToolException):
+    """Raised when Tavily answers with a non-200 status."""
+
+    def __init__(self, status: int, body: str, retry_after: Optional[float] = None):
+        super().__init__(f"Tavily API responded with status {status}: {body}")
+        self.status = status
+        self.body = body
+        self.retry_after = retry_after
+
+
+class TavilyClient:
+    """
+    Owns one aiohttp session per event loop so every Tavily call reuses pooled
+    keep-alive connections (and cached DNS) instead of a fresh TCP + TLS handshake.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = TAVILY_MAX_CONNECTIONS,
+        keepalive_timeout: float = TAVILY_KEEPALIVE_TIMEOUT,
+        connect_timeout: float = TAVILY_CONNECT_TIMEOUT,
+        request_timeout: float = TAVILY_REQUEST_TIMEOUT,
+        cache: Optional[TavilyResponseCache] = None,
+        rate_limit: float = TAVILY_RATE_LIMIT,
+        burst: float = TAVILY_BURST,
+        max_concurrency: int = TAVILY_MAX_CONCURRENCY,
+        max_retries: int = TAVILY_MAX_RETRIES,
+    ):
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.connect_timeout = connect_timeout
+        self.request_timeout = request_timeout
+        # One (session, governor) per event loop: sessions are bound to the loop that created them
+        self._pools: Dict[asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, FairGovernor]] = {}
+        self.cache = cache
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retries = 0
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.upstream_calls = 0
+        self.coalesced_calls = 0
+
+    def _get_pool(self) -> Tuple[aiohttp.ClientSession, FairGovernor]:
+        """Return this loop's session and rate limiter, creating them on first use."""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None or pool[0].closed:
+            # Loops that have been closed can no longer use (or close) their pools
+            for old_loop in [old for old in self._pools if old.is_closed()]:
+                del self._pools[old_loop]
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout, connect=self.connect_timeout),
+                headers={
+                    "Authorization": f"Bearer {TAVILY_API_KEY}",
+                    "Content-Type": "application/json",
+                },
+            )
+            pool = self._pools[loop] = (session, FairGovernor(self.max_concurrency, self.rate_limit, self.burst))
+        return pool
+
+    async def search(
+        self,
+        payload: Dict[str, Any],
+        timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Return the Tavily search response for `payload`.
+
+        With `cache_ttl`, responses younger than `cache_ttl` seconds are served
+        from the cache; older ones inside the stale window are served
+        immediately while a background task refreshes them.
+        """
+        validate_tavily_api()
+        key = payload_key(payload)
+        use_cache = bool(cache_ttl) and self.cache is not None
+        if use_cache:
+            state, data = await self.cache.get(key)
+            if state == FRESH:
+                return data
+            if state == STALE:
+                self._flight(key, payload, timeout, cache_ttl).add_done_callback(_log_refresh_failure)
+                return data
+
+        return await asyncio.shield(self._flight(key, payload, timeout, cache_ttl if use_cache else None))
+
+    def _flight(
+        self,
+        key: str,
+        payload: Dict[str, Any],
+        timeout: Optional[float],
+        cache_ttl: Optional[float],
+    ) -> asyncio.Task:
+        """
+        Return the in-flight upstream request for `key`, starting one if needed.
+
+        Concurrent callers with an identical payload share a single task
+        (single-flight), so N simultaneous searches cost one Tavily call.
+        Callers await it through asyncio.shield so one caller's cancellation
+        does not cancel the request for the others.
+        """
+        task = self._inflight.get(key)
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            self.coalesced_calls += 1
+            return task
+
+        self.upstream_calls += 1
+        task = asyncio.create_task(self._fetch_and_store(key, payload, timeout, cache_ttl, current_owner()))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._flight_done(key, done))
+        return task
+
+    def _flight_done(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark as retrieved even if every waiter went away
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        payload: Dict[str, Any],
+        timeout: Optional[float],
+        cache_ttl: Optional[float],
+        owner: str,
+    ) -> Dict[str, Any]:
+        data = await self._fetch_with_retries(payload, timeout, owner)
+        if cache_ttl:
+            await self.cache.set(key, data, cache_ttl)
+        return data
+
+    def stats(self) -> Dict[str, Any]:
+        """Upstream vs. coalesced call counters, plus response cache stats."""
+        stats = {
+            "upstream_calls": self.upstream_calls,
+            "coalesced_calls": self.coalesced_calls,
+            "in_flight": len(self._inflight),
+            "retries": self.retries,
+            "active": sum(governor.active for _, governor in self._pools.values()),
+            "queued": sum(governor.waiting for _, governor in self._pools.values()),
+        }
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
+
+    async def _fetch_with_retries(self, payload: Dict[str, Any], timeout: Optional[float], owner: str) -> Dict[str, Any]:
+        """
+        Fetch through the rate limiter, retrying 429/503 responses.
+
+        Each attempt waits for a fair, rate-limited slot and gives it back
+        before backing off. A Retry-After header pauses the whole bucket, so
+        other callers also hold off instead of collecting more 429s.
+        """
+        _, governor = self._get_pool()
+        attempt = 0
+        while True:
+            await governor.acquire(owner)
+            try:
+                return await self._fetch(payload, timeout)
+            except TavilyAPIError as e:
+                if e.status not in _RETRYABLE_STATUSES or attempt >= self.max_retries:
+                    raise
+                status = e.status
+                delay = e.retry_after if e.retry_after is not None else backoff_delay(attempt)
+                if e.retry_after is not None:
+                    governor.bucket.pause(delay)
+            finally:
+                governor.release()
+            self.retries += 1
+            attempt += 1
+            logger.info(f"Tavily returned {status}; retrying in {delay:.1f}s (attempt {attempt})")
+            await asyncio.sleep(delay)
+
+    async def _fetch(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """POST `payload` to the Tavily search endpoint and return the decoded JSON."""
+        session, _ = self._get_pool()
+        # Only override the session's ClientTimeout when asked: aiohttp reads an
+        # explicit timeout=None as "no limit at all"
+        options = {}
+        if timeout is not None:
+            options["timeout"] = aiohttp.ClientTimeout(total=timeout, connect=self.connect_timeout)
+
+        async with session.post(TAVILY_SEARCH_URL, json=payload, **options) as response:
+            if response.status != 200:
+                raise TavilyAPIError(
+                    response.status,
+                    await response.text(),
+                    retry_after_seconds(response.headers.get("Retry-After")),
+                )
+            return await response.json()
+
+    async def aclose(self):
+        """
+        Close every pooled session (call from the server's shutdown hook).
+
+        Each session is closed on its own loop: directly for the caller's loop,
+        via run_coroutine_threadsafe for loops running on other threads.
+        Sessions of loops that are already closed are just dropped.
+        """
+        for task in list(self._inflight.values()):
+            task.cancel()
+        current = asyncio.get_running_loop()
+        pools, self._pools = self._pools, {}
+        for loop, (session, _) in pools.items():
+            if session.closed:
+                continue
+            if loop is current:
+                await session.close()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+
+
+_client = TavilyClient(
+    cache=TavilyResponseCache(
+        maxsize=TAVILY_CACHE_SIZE,
+        stale_ttl=TAVILY_CACHE_STALE_TTL,
+        sqlite_path=TAVILY_CACHE_DB,
+    )
+)
+
+
+def _log_refresh_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background Tavily refresh failed: {task.exception()}")
+
+
+def get_tavily_client() -> TavilyClient:
+    """Return the process-wide Tavily client."""
+    return _client
+
+
+def get_tavily_stats() -> Dict[str, Any]:
+    """Counters for the process-wide Tavily client (calls made, calls saved, cache hits)."""
+    return _client.stats()
+
+
+async def aclose_tavily_client():
+    """Close the process-wide Tavily session."""
+    await _client.aclose()
@@ -0,0 +1,114 @@
+"""
+Two-tier response cache for Tavily searches with stale-while-revalidate.
+
+Entries are keyed on the canonical JSON of the request payload. The memory
+tier is an LRU (tools_agent.utils.cache.TTLCache); the optional SQLite tier
+survives restarts and is shared by every worker process on the host.
+"""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from tools_agent.utils.cache import TTLCache
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+def payload_key(payload: Dict[str, Any]) -> str:
+    """Canonical cache key for a request payload (key order and whitespace independent)."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _SQLiteTier:
+    """Blocking SQLite store; called from worker threads via asyncio.to_thread."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tavily_cache ("
+            " key TEXT PRIMARY KEY, stored_at REAL, fresh_ttl REAL, expires_at REAL, data TEXT)"
+        )
+        self.purge_expired()
+
+    def get(self, key: str) -> Optional[Tuple[float, float, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, fresh_ttl, data FROM tavily_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], json.loads(row[2])
+
+    def set(self, key: str, stored_at: float, fresh_ttl: float, expires_at: float, data: Any):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tavily_cache VALUES (?, ?, ?, ?, ?)",
+                (key, stored_at, fresh_ttl, expires_at, json.dumps(data)),
+            )
+
+    def purge_expired(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM tavily_cache WHERE expires_at <= ?", (time.time(),))
+
+
+class TavilyResponseCache:
+    """
+    Cache Tavily responses for `ttl` seconds, then serve them as stale for up
+    to `stale_ttl` more seconds while the caller refreshes in the background.
+    """
+
+    def __init__(self, maxsize: int = 512, stale_ttl: float = 3600.0, sqlite_path: Optional[Path] = None):
+        self.stale_ttl = stale_ttl
+        self._memory = TTLCache(maxsize=maxsize, ttl=None)
+        self._sqlite = _SQLiteTier(sqlite_path) if sqlite_path else None
+        self.stale_hits = 0
+
+    async def get(self, key: str) -> Tuple[Optional[str], Any]:
+        """Return (FRESH | STALE | None, data) for `key`."""
+        entry = self._memory.get(key)
+        if entry is None and self._sqlite is not None:
+            entry = await asyncio.to_thread(self._sqlite.get, key)
+            if entry is not None:
+                self._memory.set(key, entry, ttl=self._remaining(entry))
+        if entry is None:
+            return None, None
+
+        stored_at, fresh_ttl, data = entry
+        age = time.time() - stored_at
+        if age < fresh_ttl:
+            return FRESH, data
+        if age < fresh_ttl + self.stale_ttl:
+            self.stale_hits += 1
+            return STALE, data
+        return None, None
+
+    async def set(self, key: str, data: Any, ttl: float):
+        stored_at = time.time()
+        entry = (stored_at, ttl, data)
+        self._memory.set(key, entry, ttl=ttl + self.stale_ttl)
+        if self._sqlite is not None:
+            await asyncio.to_thread(self._sqlite.set, key, stored_at, ttl, stored_at + ttl + self.stale_ttl, data)
+
+    def _remaining(self, entry: Tuple[float, float, Any]) -> float:
+        stored_at, fresh_ttl, _ = entry
+        return max(stored_at + fresh_ttl + self.stale_ttl - time.time(), 0.001)
+
+    def clear(self):
+        self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._memory.stats()
+        stats["stale_hits"] = self.stale_hits
+        stats["sqlite"] = str(self._sqlite.path) if self._sqlite else None
+        return stats
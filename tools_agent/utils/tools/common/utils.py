@@ -1,32 +1,23 @@
 """
 Common utility functions shared across real estate tools.
 """
-import re
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
+from .patterns import (
+    ADDRESS, BUSINESS_NAME, NON_NUMERIC, PHONE, PRICE, PRICE_DIGITS, RATING, TITLE_CLEANUP
+)
 
 
 def extract_price_from_text(text: str) -> str:
     """Extract price information from text snippets."""
-    price_patterns = [
-        r'\$[\d,]+(?:\.\d+)?[KkMm]?',
-        r'[\d,]+(?:\.\d+)?[KkMm]?\s*(?:thousand|million|k|m)',
-        r'Listed\s+at\s+\$[\d,]+',
-        r'Sold\s+for\s+\$[\d,]+',
-        r'Price:\s*\$[\d,]+'
-    ]
-    
-    for pattern in price_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            return matches[0]
-    return "Price not found"
+    price = PRICE.first(text)
+    return price if price is not None else "Price not found"
 
 
 def calculate_price_per_sqft(price_str: str, sqft: int) -> str:
     """Calculate price per square foot."""
     try:
-        price_match = re.search(r'([\d,]+)', price_str.replace('$', '').replace(',', ''))
+        price_match = PRICE_DIGITS.search(price_str.replace('$', '').replace(',', ''))
         if price_match and sqft > 0:
             price = int(price_match.group(1))
             if 'k' in price_str.lower() or 'thousand' in price_str.lower():
@@ -44,80 +35,80 @@ def calculate_price_per_sqft(price_str: str, sqft: int) -> str:
 def extract_business_name(title: str, snippet: str) -> str:
     """Extract actual business name from title and snippet."""
     # Clean up title
-    title = re.sub(r'^(TOP \d+|Best|Find|Get|Search)\s+', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\s+(near|in)\s+.*$', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\s*-\s*.*Yelp.*$', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\s*-\s*.*Google.*$', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\s*\|\s*.*$', '', title)
+    for pattern, replacement in TITLE_CLEANUP:
+        title = pattern.sub(replacement, title)
     
     # Try to extract business name from snippet if title is generic
     if len(title) < 10 or any(word in title.lower() for word in ["photographer", "attorney", "company"]):
-        name_patterns = [
-            r'"([^"]+)"',
-            r'([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Photography|Law|Attorney|Company)',
-            r'Contact\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+is\s+a'
-        ]
-        
-        for pattern in name_patterns:
-            matches = re.findall(pattern, snippet)
-            if matches:
-                return matches[0].strip()
+        name = BUSINESS_NAME.first(snippet)
+        if name is not None:
+            return name.strip()
     
     return title.strip() if title.strip() else "Professional Service"
 
 
 def extract_phone(text: str) -> str:
     """Extract phone number from text."""
-    phone_patterns = [
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        r'\d{3}[-.\s]\d{3}[-.\s]\d{4}',
-        r'(?:Phone|Call|Tel):?\s*(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
-    ]
-    
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            phone = matches[0] if isinstance(matches[0], str) else matches[0]
-            return phone.strip()
-    return "📞 Call for info"
+    phone = PHONE.first(text)
+    return phone.strip() if phone is not None else "📞 Call for info"
 
 
 def extract_address(text: str) -> str:
     """Extract address from text."""
-    address_patterns = [
-        r'\d+\s+[A-Za-z0-9\s,\.]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Place|Pl)[A-Za-z0-9\s,\.]*, [A-Z]{2}\s*\d{5}',
-        r'\d+\s+[A-Za-z\s,\.]+, [A-Za-z\s]+, [A-Z]{2}\s*\d{5}',
-        r'(?:Address|Located):?\s*([^\n\r\.]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr)[^\n\r\.]*)'
-    ]
-    
-    for pattern in address_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            address = matches[0].strip()
-            return address[:60] + "..." if len(address) > 60 else address
+    address = ADDRESS.first(text)
+    if address is not None:
+        return format_address(address)
     return "📍 Address on website"
 
 
+def format_address(address: str) -> str:
+    """Trim an extracted address for display (at most 60 characters)."""
+    address = address.strip()
+    return address[:60] + "..." if len(address) > 60 else address
+
+
 def extract_rating(text: str) -> str:
     """Extract rating from text."""
-    rating_patterns = [
-        r'(\d+\.?\d*)\s*(?:out of|\/)\s*5\s*stars?',
-        r'(\d+\.?\d*)\s*stars?',
-        r'Rating:?\s*(\d+\.?\d*)',
-        r'(\d+\.?\d*)\/5',
-        r'Rated\s+(\d+\.?\d*)'
-    ]
-    
-    for pattern in rating_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            rating = float(matches[0])
-            stars = "⭐" * int(rating) + "☆" * (5 - int(rating))
-            return f"{stars} ({rating}/5)"
+    rating = RATING.first(text)
+    if rating is not None:
+        return format_rating(float(rating))
     return "⭐ Not rated yet"
 
 
+def format_rating(rating: float) -> str:
+    """Render a 0-5 rating as stars, e.g. "⭐⭐⭐⭐☆ (4.5/5)"."""
+    stars = "⭐" * int(rating) + "☆" * (5 - int(rating))
+    return f"{stars} ({rating}/5)"
+
+
+def extract_professional_details_batch(items: Iterable[Dict]) -> List[Dict[str, str]]:
+    """
+    Extract name, phone, address and rating for many search results in one call.
+
+    Each item is a search result with "title" and "snippet"; the output keeps
+    the input order.
+    """
+    details = []
+    for item in items:
+        snippet = item.get("snippet", "")
+        details.append({
+            "name": extract_business_name(item.get("title", ""), snippet),
+            "phone": extract_phone(snippet),
+            "address": extract_address(snippet),
+            "rating": extract_rating(snippet),
+        })
+    return details
+
+
+def extract_prices_batch(snippets: Iterable[str], sqft: Optional[int] = None) -> List[Tuple[str, str]]:
+    """Return (price, price per sqft) for each snippet; price per sqft is "N/A" without `sqft`."""
+    results = []
+    for snippet in snippets:
+        price = extract_price_from_text(snippet)
+        results.append((price, calculate_price_per_sqft(price, sqft) if sqft else "N/A"))
+    return results
+
+
 def format_professional_card(result: Dict, index: int) -> str:
     """Format each professional as a clean card."""
     card = f"""
@@ -126,7 +117,11 @@ def format_professional_card(result: Dict, index: int) -> str:
 ├ 📍 **Address:** {result['address']}
 ├ 📞 **Phone:** {result['phone']}  
 ├ ⭐ **Rating:** {result['rating']}
-└ 🌐 **Website:** [Click to Visit]({result['url']})
+"""
+    sources = result.get("sources") or ()
+    if len(sources) > 1:
+        card += f"├ 🔗 **Listed on:** {', '.join(sources)}\n"
+    card += f"""└ 🌐 **Website:** [Click to Visit]({result['url']})
 
 """
     return card
@@ -143,7 +138,7 @@ def validate_date_format(date_str: str) -> Optional[datetime]:
 def format_currency(amount: str) -> str:
     """Format currency string consistently."""
     # Remove any existing formatting
-    clean_amount = re.sub(r'[^\d.]', '', amount)
+    clean_amount = NON_NUMERIC.sub('', amount)
     try:
         num_amount = float(clean_amount)
         return f"${num_amount:,.0f}"
@@ -0,0 +1,142 @@
+"""
+Single-pass, streaming text chunker for FSBO documents.
+
+Pages are fed one at a time and chunks are yielded as soon as they are full,
+so only the current section's sentences are held in memory. Every chunk
+carries character offsets into the document text (pages joined with "\\n")
+and the page it starts on, so search results can cite their exact position.
+"""
+import re
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, NamedTuple
+
+# Section markers start a new section; runs of . ! ? end a sentence
+_BOUNDARY_RE = re.compile(r"(?P<section>Phase \d+:|## |Step \d+:|Section \d+:)|(?P<stop>[.!?]+)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class Chunk(NamedTuple):
+    text: str
+    start: int
+    end: int
+    page: int
+
+
+class _Sentence(NamedTuple):
+    text: str
+    start: int
+    end: int
+    page: int
+
+
+class StreamingChunker:
+    """
+    Incrementally split page text into chunks of at most `chunk_size` characters.
+
+    Sections shorter than `min_section_chars` and chunks of `min_chunk_chars` or
+    fewer are dropped. With `overlap` > 0, each chunk repeats the trailing
+    sentences (up to `overlap` characters) of the previous chunk in its section.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 600,
+        overlap: int = 0,
+        min_section_chars: int = 50,
+        min_chunk_chars: int = 30,
+    ):
+        if overlap >= chunk_size:
+            raise ValueError("overlap must be smaller than chunk_size")
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.min_section_chars = min_section_chars
+        self.min_chunk_chars = min_chunk_chars
+
+        self._offset = 0
+        self._page = 0
+        self._fragments: List[str] = []
+        self._fragment_start = 0
+        self._fragment_page = 1
+        self._buffer: Deque[_Sentence] = deque()
+        self._buffer_chars = 0
+        self._section_chars = 0
+        self._section_emitted = False
+
+    def feed(self, page_text: str) -> Iterator[Chunk]:
+        """Consume the next page and yield every chunk it completes."""
+        self._page += 1
+        pos = 0
+        for match in _BOUNDARY_RE.finditer(page_text):
+            if match.lastgroup == "stop":
+                self._add_fragment(page_text[pos:match.end()], pos)
+                yield from self._close_sentence(self._offset + match.end())
+            else:
+                self._add_fragment(page_text[pos:match.start()], pos)
+                yield from self._close_sentence(self._offset + match.start())
+                yield from self._close_section()
+            pos = match.end()
+
+        self._add_fragment(page_text[pos:], pos)
+        self._offset += len(page_text) + 1
+
+    def close(self) -> Iterator[Chunk]:
+        """Flush the final sentence and section."""
+        yield from self._close_sentence(self._offset)
+        yield from self._close_section()
+
+    def _add_fragment(self, fragment: str, page_pos: int):
+        if not self._fragments:
+            stripped = fragment.lstrip()
+            if not stripped:
+                return
+            self._fragment_start = self._offset + page_pos + len(fragment) - len(stripped)
+            self._fragment_page = self._page
+            fragment = stripped
+        self._fragments.append(fragment)
+
+    def _close_sentence(self, end: int) -> Iterator[Chunk]:
+        if not self._fragments:
+            return
+        text = _WHITESPACE_RE.sub(" ", "".join(self._fragments)).strip()
+        self._fragments = []
+        if not text:
+            return
+        sentence = _Sentence(text, self._fragment_start, end, self._fragment_page)
+        self._section_chars += len(text) + 1
+
+        if self._buffer and self._buffer_chars + len(text) > self.chunk_size:
+            chunk = self._emit()
+            if chunk is not None:
+                yield chunk
+            while self._buffer and (
+                self._buffer_chars > self.overlap or self._buffer_chars + len(text) > self.chunk_size
+            ):
+                self._buffer_chars -= len(self._buffer.popleft().text) + 1
+
+        self._buffer.append(sentence)
+        self._buffer_chars += len(text) + 1
+
+    def _close_section(self) -> Iterator[Chunk]:
+        if self._buffer and (self._section_emitted or self._section_chars >= self.min_section_chars):
+            chunk = self._emit()
+            if chunk is not None:
+                yield chunk
+        self._buffer.clear()
+        self._buffer_chars = 0
+        self._section_chars = 0
+        self._section_emitted = False
+
+    def _emit(self):
+        self._section_emitted = True
+        text = " ".join(sentence.text for sentence in self._buffer)
+        if len(text) <= self.min_chunk_chars:
+            return None
+        return Chunk(text, self._buffer[0].start, self._buffer[-1].end, self._buffer[0].page)
+
+
+def iter_chunks(pages: Iterable[str], chunk_size: int = 600, overlap: int = 0) -> Iterator[Chunk]:
+    """Yield chunks for a document given as an iterable of page texts."""
+    chunker = StreamingChunker(chunk_size=chunk_size, overlap=overlap)
+    for page_text in pages:
+        yield from chunker.feed(page_text)
+    yield from chunker.close()
@@ -0,0 +1,148 @@
+"""
+Dense (vector) retrieval backend for the FSBO knowledge base.
+
+Chunk embeddings live in one contiguous float32 matrix that is saved to disk
+and memory-mapped back, so every worker process shares the same pages. The
+default embedding is a deterministic hashed bag-of-words, which needs no model
+download or network access.
+"""
+import math
+import os
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .search_index import tokenize
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Bump when the embedding function changes so stale matrices are not reused
+EMBEDDING_VERSION = 1
+DEFAULT_EMBEDDING_DIM = 512
+
+
+def hashed_embedding(text: str, dim: int = DEFAULT_EMBEDDING_DIM) -> "np.ndarray":
+    """
+    Embed `text` with the signed hashing trick over unigrams and bigrams.
+
+    Uses crc32 rather than hash() so vectors are identical across processes.
+    The result is L2-normalised, so dot products are cosine similarities.
+    """
+    terms = tokenize(text)
+    features = Counter(terms)
+    features.update(f"{a} {b}" for a, b in zip(terms, terms[1:]))
+
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature, count in features.items():
+        h = zlib.crc32(feature.encode("utf-8"))
+        sign = 1.0 if h & 0x80000000 else -1.0
+        vector[h % dim] += sign * (1.0 + math.log(count))
+
+    norm = float(np.linalg.norm(vector))
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+EmbeddingFn = Callable[[str, int], "np.ndarray"]
+
+
+class DenseIndex:
+    """Cosine-similarity search over a (num_chunks x dim) float32 embedding matrix."""
+
+    def __init__(self, matrix: "np.ndarray", embed: EmbeddingFn = hashed_embedding):
+        self.matrix = matrix
+        self.dim = matrix.shape[1]
+        self.embed = embed
+
+    @classmethod
+    def build(
+        cls,
+        texts: Sequence[str],
+        dim: int = DEFAULT_EMBEDDING_DIM,
+        embed: EmbeddingFn = hashed_embedding,
+        cache_path: Optional[Path] = None,
+    ) -> "DenseIndex":
+        """
+        Embed `texts` into a contiguous matrix, or memory-map it from `cache_path`.
+
+        The caller is responsible for choosing a cache path that changes
+        whenever the texts, dimension or embedding function change.
+        """
+        if cache_path is not None and cache_path.exists():
+            try:
+                matrix = np.load(cache_path, mmap_mode="r")
+                if matrix.shape == (len(texts), dim) and matrix.dtype == np.float32:
+                    return cls(matrix, embed)
+            except (OSError, ValueError):
+                pass
+
+        matrix = np.empty((len(texts), dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            matrix[row] = embed(text, dim)
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp.npy")
+                np.save(tmp_path, matrix)
+                os.replace(tmp_path, cache_path)
+                matrix = np.load(cache_path, mmap_mode="r")
+            except OSError as e:
+                print(f"  Could not write embedding cache {cache_path}: {e}")
+
+        return cls(matrix, embed)
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def scores(self, query: str) -> "np.ndarray":
+        """Return the cosine similarity of `query` to every chunk (one matrix-vector product)."""
+        return self.matrix @ self.embed(query, self.dim)
+
+    def search(self, query: str, k: int) -> List[Tuple[float, int]]:
+        """Return up to `k` (score, chunk_id) pairs with positive similarity, best first."""
+        return self.top_k(self.scores(query), k)
+
+    def search_many(self, queries: Sequence[str], k: int) -> List[List[Tuple[float, int]]]:
+        """Answer several queries with a single matrix-matrix product."""
+        if not queries:
+            return []
+        query_matrix = np.stack([self.embed(query, self.dim) for query in queries])
+        all_scores = self.matrix @ query_matrix.T
+        return [self.top_k(all_scores[:, col], k) for col in range(len(queries))]
+
+    @staticmethod
+    def top_k(scores: "np.ndarray", k: int) -> List[Tuple[float, int]]:
+        """Select the best `k` entries with argpartition, then sort only those."""
+        if k <= 0 or scores.size == 0:
+            return []
+        k = min(k, scores.size)
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [(float(scores[i]), int(i)) for i in candidates if scores[i] > 0]
+
+
+def hybrid_rank(
+    keyword_scores: dict,
+    dense_scores: "np.ndarray",
+    k: int,
+    alpha: float = 0.5,
+) -> List[Tuple[float, int]]:
+    """
+    Blend keyword and dense scores: alpha * cosine + (1 - alpha) * keyword / max(keyword).
+
+    Keyword scores are max-normalised so both signals sit on a 0..1 scale.
+    """
+    max_keyword = max(keyword_scores.values(), default=0.0)
+    combined = alpha * np.clip(dense_scores, 0.0, None)
+    if max_keyword > 0:
+        ids = np.fromiter(keyword_scores.keys(), dtype=np.int64, count=len(keyword_scores))
+        values = np.fromiter(keyword_scores.values(), dtype=np.float32, count=len(keyword_scores))
+        combined[ids] += (1.0 - alpha) * values / max_keyword
+    return DenseIndex.top_k(combined, k)
@@ -1,11 +1,23 @@
 # tools_agent/utils/tools/integrations/rag.py
 
+import os
 import json
-import re
+import asyncio
+import hashlib
+import multiprocessing
+import threading
 import aiohttp
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Annotated
+from typing import List, Dict, NamedTuple, Optional, Annotated
 from langchain_core.tools import tool, StructuredTool, ToolException
+from tools_agent.utils.cache import TTLCache
+from .search_index import InvertedIndex, query_key
+from .chunking import iter_chunks
+from .dense_index import NUMPY_AVAILABLE, EMBEDDING_VERSION, DEFAULT_EMBEDDING_DIM, hybrid_rank
+
+if NUMPY_AVAILABLE:
+    from .dense_index import DenseIndex
 
 try:
     import PyPDF2
@@ -13,140 +25,491 @@ try:
 except ImportError:
     PDF_AVAILABLE = False
 
+# Extracted text and chunks are cached here, keyed by PDF content hash.
+# Bump CHUNK_CACHE_VERSION whenever extraction or chunking logic changes.
+CHUNK_CACHE_DIR = Path(os.getenv("FSBO_CACHE_DIR", "~/.cache/tools_agent/fsbo")).expanduser()
+CHUNK_CACHE_VERSION = 2
+
+# Chunker settings; overlap repeats up to this many trailing characters of the previous chunk
+CHUNK_SIZE = int(os.getenv("FSBO_CHUNK_SIZE", "600"))
+CHUNK_OVERLAP = int(os.getenv("FSBO_CHUNK_OVERLAP", "0"))
+
+# "keyword" (BM25), "dense" (embedding similarity) or "hybrid" (blend of both)
+SEARCH_MODE = os.getenv("FSBO_SEARCH_MODE", "keyword")
+HYBRID_ALPHA = float(os.getenv("FSBO_HYBRID_ALPHA", "0.5"))
+SEARCH_MODES = ("keyword", "dense", "hybrid")
+
+# Every PDF matching FSBO_DOCS_GLOB in FSBO_DOCS_DIR is ingested
+DEFAULT_DOCS_DIR = Path(__file__).parent.parent.parent.parent.parent / "static"
+DOCS_DIR = Path(os.getenv("FSBO_DOCS_DIR", str(DEFAULT_DOCS_DIR))).expanduser()
+DOCS_GLOB = os.getenv("FSBO_DOCS_GLOB", "*.pdf")
+# Worker processes for PDF text extraction (0 = one per CPU core)
+INGEST_WORKERS = int(os.getenv("FSBO_INGEST_WORKERS", "0"))
+# Seconds between polls of the document directory for changes (0 = no watcher)
+WATCH_INTERVAL = float(os.getenv("FSBO_WATCH_INTERVAL", "0"))
+# Search result cache, keyed on the normalized query and max_results
+QUERY_CACHE_SIZE = int(os.getenv("FSBO_QUERY_CACHE_SIZE", "1024"))
+QUERY_CACHE_TTL = float(os.getenv("FSBO_QUERY_CACHE_TTL", "600"))
+
+# Display names for known files; other PDFs are titled after their file name
+DOCUMENT_TITLES = {
+    "SelfNVest Google Step by Step.pdf": "SelfNVest Google Guide",
+}
+
+
+def _extract_pdf_pages(pdf_path: str):
+    """
+    Extract the text of each page of a PDF file.
+
+    Module-level so it can run in a worker process. Returns the list of page
+    texts, or an error message string if the PDF could not be read.
+    """
+    if not PDF_AVAILABLE:
+        return "PyPDF2 not installed. Install with: pip install PyPDF2"
+
+    try:
+        with open(pdf_path, 'rb') as file:
+            reader = PyPDF2.PdfReader(file)
+            return [page.extract_text() or "" for page in reader.pages]
+    except Exception as e:
+        return f"Error reading PDF: {str(e)}"
+
+
+class _Corpus(NamedTuple):
+    """Everything a search reads, swapped in as one object so readers never see a partial reload."""
+    documents: Dict
+    index: Optional[InvertedIndex]
+    dense_index: object
+    chunk_refs: List[tuple]
+    signatures: Dict[str, tuple]
+    generation: int
+
+
+_EMPTY_CORPUS = _Corpus({}, None, None, [], {}, 0)
+
+
+def _file_signature(path: Path) -> tuple:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 class FSBORAG:
-    def __init__(self):
-        self.documents = {}
-        self._load_pdf_documents()
-    
-    def _extract_text_from_pdf(self, pdf_path: Path) -> str:
-        """Extract text content from PDF file."""
-        if not PDF_AVAILABLE:
-            return "PyPDF2 not installed. Install with: pip install PyPDF2"
-        
+    def __init__(
+        self,
+        autoload: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+        chunk_overlap: int = CHUNK_OVERLAP,
+        cache_dir: Optional[Path] = CHUNK_CACHE_DIR,
+        search_mode: str = SEARCH_MODE,
+        embedding_dim: int = DEFAULT_EMBEDDING_DIM,
+        docs_dir: Path = DOCS_DIR,
+        docs_glob: str = DOCS_GLOB,
+        ingest_workers: int = INGEST_WORKERS,
+        watch_interval: float = WATCH_INTERVAL,
+    ):
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"search_mode must be one of {SEARCH_MODES}, got {search_mode!r}")
+        if search_mode != "keyword" and not NUMPY_AVAILABLE:
+            print(f"NumPy not installed; FSBO search falling back from {search_mode!r} to keyword mode")
+            search_mode = "keyword"
+
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.search_mode = search_mode
+        self.embedding_dim = embedding_dim
+        self.docs_dir = Path(docs_dir)
+        self.docs_glob = docs_glob
+        self.ingest_workers = ingest_workers or os.cpu_count() or 1
+        self.watch_interval = watch_interval
+        self._corpus = _EMPTY_CORPUS
+        self._load_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._load_future: Optional[Future] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+        self._query_cache = TTLCache(maxsize=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL)
+        if autoload:
+            self.ensure_loaded()
+
+    @property
+    def documents(self) -> Dict:
+        """The currently loaded documents, keyed by document name."""
+        return self._corpus.documents
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once PDF ingestion has finished successfully."""
+        future = self._load_future
+        return future is not None and future.done() and future.exception() is None
+
+    def warm_up(self) -> Future:
+        """
+        Start PDF ingestion in a background thread and return its future.
+
+        Every caller shares the same future, so concurrent first searches wait
+        on a single load instead of each parsing the PDFs again. A failed load
+        is forgotten so the next call can retry.
+        """
+        with self._load_lock:
+            if self._load_future is None:
+                self._load_future = Future()
+                threading.Thread(
+                    target=self._run_load,
+                    args=(self._load_future,),
+                    name="fsbo-rag-loader",
+                    daemon=True,
+                ).start()
+            return self._load_future
+
+    def _run_load(self, future: Future):
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
+            self._refresh()
         except Exception as e:
-            return f"Error reading PDF: {str(e)}"
-    
-    def _chunk_text(self, text: str, chunk_size: int = 600) -> List[str]:
-        """Split text into searchable chunks."""
-        # Clean up text
-        text = re.sub(r'\n+', '\n', text)
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Split by sections first (look for common section markers)
-        sections = re.split(r'(?:Phase \d+:|## |Step \d+:|Section \d+:)', text)
-        
-        chunks = []
-        for section in sections:
-            section = section.strip()
-            if len(section) < 50:  # Skip very short sections
+            with self._load_lock:
+                self._load_future = None
+            future.set_exception(e)
+        else:
+            future.set_result(self.documents)
+            if self.watch_interval > 0:
+                self.start_watching()
+
+    def ensure_loaded(self, timeout: Optional[float] = None):
+        """Block until the documents are loaded, starting the load if needed."""
+        self.warm_up().result(timeout)
+
+    async def aensure_loaded(self):
+        """Await document loading without blocking the event loop."""
+        await asyncio.wrap_future(self.warm_up())
+
+    def reload(self) -> Dict[str, List[str]]:
+        """
+        Re-scan the document directory and re-ingest only added or changed PDFs.
+
+        The new corpus is built off to the side and swapped in with a single
+        assignment, so in-flight searches keep using the previous one.
+        Returns the names of added, changed and removed documents.
+        """
+        self.ensure_loaded()
+        return self._refresh()
+
+    async def areload(self) -> Dict[str, List[str]]:
+        """Reload the corpus from a worker thread without blocking the event loop."""
+        await self.aensure_loaded()
+        return await asyncio.to_thread(self._refresh)
+
+    def _refresh(self) -> Dict[str, List[str]]:
+        with self._reload_lock:
+            return self._load_pdf_documents(self._corpus)
+
+    def _scan_signatures(self) -> Dict[str, tuple]:
+        signatures = {}
+        for pdf_path in self._discover_pdfs().values():
+            try:
+                signatures[str(pdf_path)] = _file_signature(pdf_path)
+            except OSError:
                 continue
-                
-            # If section is small enough, keep as one chunk
-            if len(section) <= chunk_size:
-                chunks.append(section)
-            else:
-                # Split large sections by sentences
-                sentences = re.split(r'[.!?]+', section)
-                current_chunk = ""
-                
-                for sentence in sentences:
-                    sentence = sentence.strip()
-                    if not sentence:
-                        continue
-                        
-                    if len(current_chunk + sentence) < chunk_size:
-                        current_chunk += sentence + ". "
-                    else:
-                        if current_chunk:
-                            chunks.append(current_chunk.strip())
-                        current_chunk = sentence + ". "
-                
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-        
-        return [chunk for chunk in chunks if len(chunk.strip()) > 30]
+        return signatures
+
+    def start_watching(self, interval: Optional[float] = None):
+        """Poll the document directory every `interval` seconds and reload on changes."""
+        interval = interval or self.watch_interval or 30.0
+        with self._load_lock:
+            if self._watcher is not None and self._watcher.is_alive():
+                return
+            self._watcher_stop.clear()
+            self._watcher = threading.Thread(
+                target=self._watch_loop,
+                args=(interval,),
+                name="fsbo-rag-watcher",
+                daemon=True,
+            )
+            self._watcher.start()
+
+    def stop_watching(self):
+        """Stop the directory watcher, if running."""
+        self._watcher_stop.set()
+
+    def _watch_loop(self, interval: float):
+        while not self._watcher_stop.wait(interval):
+            try:
+                if self._scan_signatures() != self._corpus.signatures:
+                    changes = self._refresh()
+                    print(f"FSBO knowledge base reloaded: {changes}")
+            except Exception as e:
+                print(f"FSBO knowledge base reload failed: {e}")
     
-    def _load_pdf_documents(self):
-        """Load PDF documents from static folder."""
-        static_dir = Path(__file__).parent.parent.parent.parent.parent / "static"
-        
-        pdf_files = {
-            "SelfNVest Google Guide": "SelfNVest Google Step by Step.pdf",
-            # Add more PDFs here as you get them
-            # "Kentucky FSBO Guide": "Kentucky_FSBO_Guide.pdf",
-            # "FSBO FAQ": "FSBO_Seller_FAQ.pdf"
+    def _extract_pages(self, pdf_paths: List[Path]) -> Dict[Path, object]:
+        """
+        Extract several PDFs in parallel, one document per worker process.
+
+        Workers are spawned, not forked: this runs on the lazy-load thread of a
+        multithreaded server process, and a forked child would inherit its
+        locks and event loop mid-use.
+        """
+        if len(pdf_paths) <= 1 or self.ingest_workers <= 1:
+            return {path: _extract_pdf_pages(str(path)) for path in pdf_paths}
+
+        workers = min(self.ingest_workers, len(pdf_paths))
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                results = pool.map(_extract_pdf_pages, [str(path) for path in pdf_paths])
+                return dict(zip(pdf_paths, results))
+        except (OSError, RuntimeError) as e:
+            print(f"  Parallel PDF extraction unavailable ({e}); extracting serially")
+            return {path: _extract_pdf_pages(str(path)) for path in pdf_paths}
+
+    def _chunk_pages(self, pages: List[str]) -> List[list]:
+        """Chunk a document page by page into [text, start, end, page] records."""
+        return [
+            [chunk.text, chunk.start, chunk.end, chunk.page]
+            for chunk in iter_chunks(pages, self.chunk_size, self.chunk_overlap)
+        ]
+    
+    def _chunk_params_key(self) -> str:
+        """Identify the chunker settings so a settings change invalidates cached chunks."""
+        return f"v{CHUNK_CACHE_VERSION}-size{self.chunk_size}-overlap{self.chunk_overlap}"
+
+    def _read_chunk_cache(self, cache_path: Path) -> Dict:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if entry.get('version') == CHUNK_CACHE_VERSION:
+                return entry
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _write_chunk_cache(self, cache_path: Path, entry: Dict):
+        """Write a cache entry atomically so concurrent workers never read a partial file."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"  Could not write chunk cache {cache_path}: {e}")
+
+    def _cache_lookup(self, pdf_path: Path) -> tuple:
+        """
+        Return (cache_path, cache_entry) for a PDF.
+
+        The cache file is named after the PDF's SHA-256, so editing the PDF
+        produces a miss; the chunks inside are keyed by the chunker settings, so
+        changing those re-chunks the cached pages without re-parsing the PDF.
+        """
+        if self.cache_dir is None:
+            return None, {}
+        digest = hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+        cache_path = self.cache_dir / f"{digest}.json"
+        return cache_path, self._read_chunk_cache(cache_path)
+
+    def _discover_pdfs(self) -> Dict[str, Path]:
+        """Map document names to the PDFs found in the configured directory."""
+        if not self.docs_dir.exists():
+            print(f"  FSBO document directory not found: {self.docs_dir}")
+            return {}
+        return {
+            DOCUMENT_TITLES.get(pdf_path.name, pdf_path.stem): pdf_path
+            for pdf_path in sorted(self.docs_dir.glob(self.docs_glob))
+            if pdf_path.is_file()
         }
-        
-        for doc_name, filename in pdf_files.items():
-            pdf_path = static_dir / filename
-            
-            if pdf_path.exists():
-                print(f"Loading {doc_name}...")
-                text_content = self._extract_text_from_pdf(pdf_path)
-                
-                if not text_content.startswith("Error") and not text_content.startswith("PyPDF2"):
-                    chunks = self._chunk_text(text_content)
-                    self.documents[doc_name] = {
-                        'chunks': chunks,
-                        'source_file': str(pdf_path),
-                        'total_chunks': len(chunks)
-                    }
-                    print(f"  Loaded {len(chunks)} chunks from {filename}")
-                else:
-                    print(f"  Error loading {filename}: {text_content}")
-            else:
-                print(f"  File not found: {pdf_path}")
-                # Try to list what files ARE in the static directory
-                if static_dir.exists():
-                    available_files = list(static_dir.glob("*.pdf"))
-                    print(f"  Available PDFs in static: {[f.name for f in available_files]}")
+
+    def _load_pdf_documents(self, previous: _Corpus = _EMPTY_CORPUS) -> Dict[str, List[str]]:
+        """
+        Load every PDF in the document directory and swap in the new corpus.
+
+        Documents whose file signature (mtime, size) is unchanged since
+        `previous` are reused as-is; the rest go through the chunk cache and,
+        on a miss, PDF extraction. Returns the added/changed/removed names.
+        """
+        params_key = self._chunk_params_key()
+        pdf_files = self._discover_pdfs()
+        if not pdf_files:
+            print(f"  No PDFs matching {self.docs_glob!r} in {self.docs_dir}")
+
+        signatures = {}
+        reused = {}
+        for doc_name, pdf_path in pdf_files.items():
+            signatures[str(pdf_path)] = _file_signature(pdf_path)
+            old_doc = previous.documents.get(doc_name)
+            if (
+                old_doc is not None
+                and old_doc['source_file'] == str(pdf_path)
+                and previous.signatures.get(str(pdf_path)) == signatures[str(pdf_path)]
+            ):
+                reused[doc_name] = old_doc
+
+        lookups = {}
+        chunks_by_doc = {}
+        for doc_name, pdf_path in pdf_files.items():
+            if doc_name in reused:
+                continue
+            print(f"Loading {doc_name}...")
+            cache_path, entry = self._cache_lookup(pdf_path)
+            lookups[doc_name] = (cache_path, entry)
+            if params_key in entry.get('chunks', {}):
+                chunks_by_doc[doc_name] = entry['chunks'][params_key]
+
+        to_extract = [
+            pdf_files[doc_name] for doc_name, (_, entry) in lookups.items()
+            if doc_name not in chunks_by_doc and entry.get('pages') is None
+        ]
+        extracted = self._extract_pages(to_extract)
+
+        for doc_name, (cache_path, entry) in lookups.items():
+            if doc_name in chunks_by_doc:
+                continue
+            pdf_path = pdf_files[doc_name]
+            pages = entry.get('pages')
+            if pages is None:
+                pages = extracted[pdf_path]
+                if isinstance(pages, str):
+                    print(f"  Error loading {pdf_path.name}: {pages}")
+                    continue
+
+            chunks = self._chunk_pages(pages)
+            chunks_by_doc[doc_name] = chunks
+            if cache_path is not None:
+                self._write_chunk_cache(cache_path, {
+                    'version': CHUNK_CACHE_VERSION,
+                    'source_file': pdf_path.name,
+                    'pages': pages,
+                    'chunks': {**entry.get('chunks', {}), params_key: chunks},
+                })
+
+        documents = {}
+        for doc_name, pdf_path in pdf_files.items():
+            if doc_name in reused:
+                documents[doc_name] = reused[doc_name]
+            elif doc_name in chunks_by_doc:
+                records = chunks_by_doc[doc_name]
+                chunks = [record[0] for record in records]
+                documents[doc_name] = {
+                    'chunks': chunks,
+                    'spans': [tuple(record[1:]) for record in records],
+                    'source_file': str(pdf_path),
+                    'total_chunks': len(chunks)
+                }
+                print(f"  Loaded {len(chunks)} chunks from {pdf_path.name}")
+
+        index, dense_index, chunk_refs = self._build_index(documents)
+        self._corpus = _Corpus(documents, index, dense_index, chunk_refs, signatures, previous.generation + 1)
+        # Entries are keyed by generation, so this only frees memory; stale hits are impossible
+        self._query_cache.clear()
+
+        return {
+            'added': [name for name in documents if name not in previous.documents],
+            'changed': [name for name in documents if name in previous.documents and name not in reused],
+            'removed': [name for name in previous.documents if name not in documents],
+        }
+
+    def _build_index(self, documents: Dict) -> tuple:
+        """Build the keyword (and, if enabled, dense) index over every chunk of every document."""
+        chunk_refs = []
+        texts = []
+        for doc_name, doc_info in documents.items():
+            for i, chunk in enumerate(doc_info.get('chunks', [])):
+                chunk_refs.append((doc_name, i))
+                texts.append(chunk)
+        index = InvertedIndex(texts)
+        dense_index = None
+        if self.search_mode != "keyword":
+            dense_index = DenseIndex.build(
+                texts,
+                dim=self.embedding_dim,
+                cache_path=self._embedding_cache_path(texts),
+            )
+        return index, dense_index, chunk_refs
+
+    def _embedding_cache_path(self, texts: List[str]) -> Optional[Path]:
+        """Name the embedding matrix after the exact chunk set and embedding settings."""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256()
+        digest.update(f"v{EMBEDDING_VERSION}-dim{self.embedding_dim}".encode("utf-8"))
+        for text in texts:
+            digest.update(b"\0" + text.encode("utf-8"))
+        return self.cache_dir / f"embeddings-{digest.hexdigest()}.npy"
     
+    def cache_stats(self) -> Dict:
+        """Return size and hit-rate counters for the search result cache."""
+        return self._query_cache.stats()
+
     def search(self, query: str, max_results: int = 2) -> List[Dict]:
-        """Search through documents using keyword matching."""
-        if not self.documents:
+        """
+        Search through documents using the configured keyword, dense or hybrid ranking.
+
+        Results are cached per corpus generation under query_key(query), which
+        covers everything ranking reads, so a cached answer is exactly what
+        ranking would return. Repeated questions (differing at most in case
+        or spacing) skip ranking; rephrasings are ranked afresh.
+        """
+        self.ensure_loaded()
+        corpus = self._corpus
+        if not corpus.documents or corpus.index is None:
             return []
-        
-        query_words = query.lower().split()
+
+        cache_key = (corpus.generation, query_key(query), max_results)
+        cached = self._query_cache.get(cache_key)
+        if cached is None:
+            cached = self._rank(corpus, query, max_results)
+            self._query_cache.set(cache_key, cached)
+        return [dict(result) for result in cached]
+
+    def _rank(self, corpus: _Corpus, query: str, max_results: int) -> List[Dict]:
+        """Rank chunks of one corpus snapshot for `query`."""
+        if not query.strip():
+            return []
+
+        if self.search_mode == "dense":
+            ranked = corpus.dense_index.search(query, max_results)
+        elif self.search_mode == "hybrid":
+            ranked = hybrid_rank(
+                corpus.index.scores(query),
+                corpus.dense_index.scores(query),
+                max_results,
+                alpha=HYBRID_ALPHA,
+            )
+        else:
+            ranked = corpus.index.search(query, max_results)
+
         results = []
-        
-        for doc_name, doc_info in self.documents.items():
-            chunks = doc_info.get('chunks', [])
-            
-            for i, chunk in enumerate(chunks):
-                chunk_lower = chunk.lower()
-                
-                # Count exact word matches (higher score)
-                exact_matches = sum(1 for word in query_words if word in chunk_lower)
-                
-                # Count partial matches (lower score)
-                partial_matches = sum(0.5 for word in query_words 
-                                    if any(word in chunk_word for chunk_word in chunk_lower.split()))
-                
-                score = exact_matches + partial_matches
-                
-                if score > 0:
-                    results.append({
-                        'document': doc_name,
-                        'chunk_index': i,
-                        'chunk_text': chunk,
-                        'score': score,
-                        'source_file': doc_info.get('source_file', 'unknown')
-                    })
-        
-        # Sort by score and return top results
-        results.sort(key=lambda x: x['score'], reverse=True)
-        return results[:max_results]
+        for score, chunk_id in ranked:
+            doc_name, i = corpus.chunk_refs[chunk_id]
+            doc_info = corpus.documents[doc_name]
+            start, end, page = doc_info['spans'][i]
+            results.append({
+                'document': doc_name,
+                'chunk_index': i,
+                'chunk_text': doc_info['chunks'][i],
+                'score': score,
+                'source_file': doc_info.get('source_file', 'unknown'),
+                'page': page,
+                'start': start,
+                'end': end
+            })
+        return results
 
-# Initialize the RAG system (loads PDFs automatically)
+# The RAG system loads its PDFs lazily on first search or via warm_up_fsbo_knowledge()
 _fsbo_rag = FSBORAG()
 
+
+def warm_up_fsbo_knowledge() -> Future:
+    """Start loading the FSBO PDFs in the background (e.g. from a server startup hook)."""
+    return _fsbo_rag.warm_up()
+
+
+async def reload_fsbo_knowledge() -> Dict[str, List[str]]:
+    """Pick up added, changed or removed PDFs without restarting the server."""
+    return await _fsbo_rag.areload()
+
+
+def get_fsbo_search_cache_stats() -> Dict:
+    """Hit/miss counters for the FSBO search result cache."""
+    return _fsbo_rag.cache_stats()
+
 @tool
 async def search_fsbo_knowledge(
     query: Annotated[str, "Search query for FSBO information, legal requirements, pricing, marketing, etc."]
@@ -156,6 +519,7 @@ async def search_fsbo_knowledge(
     Covers legal requirements, pricing strategies, marketing tips, and closing processes.
     """
     try:
+        await _fsbo_rag.aensure_loaded()
         results = _fsbo_rag.search(query, max_results=2)
         
         if not results:
@@ -172,7 +536,7 @@ async def search_fsbo_knowledge(
                 chunk_text = chunk_text[:500] + "..."
             
             response += f"{chunk_text}\n\n"
-            response += f"_Source: {Path(result['source_file']).name}_\n\n"
+            response += f"_Source: {Path(result['source_file']).name}, page {result['page']}_\n\n"
         
         return response.strip()
         
@@ -183,6 +547,7 @@ async def search_fsbo_knowledge(
 async def list_fsbo_documents() -> str:
     """List all FSBO documents currently loaded in the knowledge base."""
     try:
+        await _fsbo_rag.aensure_loaded()
         if not _fsbo_rag.documents:
             return "No FSBO documents loaded. Check that PDF files are in the static/ folder."
         
@@ -0,0 +1,156 @@
+"""
+Inverted keyword index with BM25 ranking for the FSBO knowledge base.
+"""
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Score added per query term that only appears inside a longer word (e.g. "price" in "pricing")
+PARTIAL_MATCH_WEIGHT = 0.5
+
+# Longest character n-gram stored in the substring index
+NGRAM_SIZE = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase `text` and split it into alphanumeric terms."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def query_key(query: str) -> str:
+    """
+    Cache key holding everything ranking reads from a query.
+
+    BM25 and dense ranking only see tokenize(query), and partial matches see
+    the lowercased whitespace-split words, both fixed by the lowercased words
+    in order. "Home  Price" and "home price" share a key; "price home" does not.
+    """
+    return " ".join(query.lower().split())
+
+
+class InvertedIndex:
+    """
+    Term -> postings index over a fixed list of text chunks.
+
+    Built once at ingestion time; queries only touch the postings of their own
+    terms, so search cost no longer grows with the total number of chunks.
+    """
+
+    def __init__(self, texts: Iterable[str], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self.doc_lengths: List[int] = []
+        # Partial matches compare raw whitespace-separated words, punctuation included
+        word_docs: Dict[str, set] = defaultdict(set)
+
+        for doc_id, text in enumerate(texts):
+            lowered = text.lower()
+            terms = tokenize(lowered)
+            self.doc_lengths.append(len(terms))
+            for term, freq in Counter(terms).items():
+                self.postings[term].append((doc_id, freq))
+            for word in set(lowered.split()):
+                word_docs[word].add(doc_id)
+
+        self.postings = dict(self.postings)
+        self._word_docs = {word: frozenset(docs) for word, docs in word_docs.items()}
+        self._ngrams = self._build_ngram_index(self._word_docs)
+        self.doc_count = len(self.doc_lengths)
+        self.avg_doc_length = sum(self.doc_lengths) / self.doc_count if self.doc_count else 0.0
+        self._idf = {
+            term: math.log(1 + (self.doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+
+    @staticmethod
+    def _build_ngram_index(vocabulary: Iterable[str]) -> Dict[str, frozenset]:
+        """Map every character n-gram (length 1..NGRAM_SIZE) to the vocabulary words containing it."""
+        ngrams: Dict[str, set] = defaultdict(set)
+        for term in vocabulary:
+            for n in range(1, NGRAM_SIZE + 1):
+                for start in range(len(term) - n + 1):
+                    ngrams[term[start:start + n]].add(term)
+        return {gram: frozenset(terms) for gram, terms in ngrams.items()}
+
+    def words_containing(self, fragment: str) -> frozenset:
+        """
+        Return every chunk word (lowercased, whitespace-split) that has `fragment` as a substring.
+
+        Short fragments are answered by a single n-gram lookup; longer ones
+        intersect the sets of their n-grams and verify the few survivors.
+        """
+        if len(fragment) <= NGRAM_SIZE:
+            return self._ngrams.get(fragment, frozenset())
+
+        grams = sorted(
+            (fragment[i:i + NGRAM_SIZE] for i in range(len(fragment) - NGRAM_SIZE + 1)),
+            key=lambda gram: len(self._ngrams.get(gram, ())),
+        )
+        candidates = self._ngrams.get(grams[0])
+        if not candidates:
+            return frozenset()
+        for gram in grams[1:]:
+            candidates = candidates & self._ngrams.get(gram, frozenset())
+            if not candidates:
+                return frozenset()
+        return frozenset(term for term in candidates if fragment in term)
+
+    def __len__(self) -> int:
+        return self.doc_count
+
+    def bm25_scores(self, query_terms: Iterable[str]) -> Dict[int, float]:
+        """Return BM25 scores for every chunk that contains at least one query term."""
+        scores: Dict[int, float] = defaultdict(float)
+        k1, b, avgdl = self.k1, self.b, self.avg_doc_length or 1.0
+        for term in set(query_terms):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = self._idf[term]
+            for doc_id, freq in docs:
+                norm = k1 * (1 - b + b * self.doc_lengths[doc_id] / avgdl)
+                scores[doc_id] += idf * freq * (k1 + 1) / (freq + norm)
+        return scores
+
+    def partial_match_counts(self, query_words: Iterable[str]) -> Dict[int, int]:
+        """
+        Count, per chunk, the query words that occur inside some word of the chunk.
+
+        Same semantics as the original per-chunk loop: words are the
+        lowercased, whitespace-split tokens of query and chunk (punctuation
+        kept), and a repeated query word counts once per repetition. Matching
+        words come from the n-gram index, so no chunk text is scanned.
+        """
+        counts: Dict[int, int] = defaultdict(int)
+        for word, repeats in Counter(query_words).items():
+            matched_docs = set()
+            for chunk_word in self.words_containing(word):
+                matched_docs.update(self._word_docs[chunk_word])
+            for doc_id in matched_docs:
+                counts[doc_id] += repeats
+        return counts
+
+    def scores(self, query: str) -> Dict[int, float]:
+        """Return BM25 plus partial-match scores for every chunk matching `query`."""
+        query_terms = tokenize(query)
+        query_words = query.lower().split()
+        if not query_words:
+            return {}
+
+        scores = self.bm25_scores(query_terms)
+        for doc_id, count in self.partial_match_counts(query_words).items():
+            scores[doc_id] = scores.get(doc_id, 0.0) + PARTIAL_MATCH_WEIGHT * count
+        return scores
+
+    def search(self, query: str, k: int) -> List[Tuple[float, int]]:
+        """Return up to `k` (score, chunk_id) pairs, best first, ties broken by chunk order."""
+        if k <= 0:
+            return []
+        scores = self.scores(query)
+        top = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(score, doc_id) for doc_id, score in top if score > 0]
@@ -0,0 +1,138 @@
+"""
+Shared client for the FastAPI listing backend with pooled keep-alive connections.
+"""
+import asyncio
+import importlib.util
+import logging
+from typing import Any, Dict, Optional
+import httpx
+from ..common.config import (
+    LISTING_API_BASE_URL,
+    LISTING_API_MAX_CONNECTIONS,
+    LISTING_API_KEEPALIVE_EXPIRY,
+    LISTING_API_CONNECT_TIMEOUT,
+    LISTING_API_READ_TIMEOUT,
+    LISTING_API_POOL_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+# httpx only speaks HTTP/2 with the optional h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class ListingAPIClient:
+    """
+    Owns one httpx.AsyncClient per event loop so every listing call reuses
+    pooled keep-alive connections instead of paying a fresh TCP + TLS
+    handshake against the (slow to accept) backend.
+    """
+
+    def __init__(
+        self,
+        base_url: str = LISTING_API_BASE_URL,
+        max_connections: int = LISTING_API_MAX_CONNECTIONS,
+        keepalive_expiry: float = LISTING_API_KEEPALIVE_EXPIRY,
+        connect_timeout: float = LISTING_API_CONNECT_TIMEOUT,
+        read_timeout: float = LISTING_API_READ_TIMEOUT,
+        pool_timeout: float = LISTING_API_POOL_TIMEOUT,
+        http2: bool = HTTP2_AVAILABLE,
+    ):
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.pool_timeout = pool_timeout
+        self.http2 = http2
+        # Clients are bound to the loop that created them; a new loop gets a new pool
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self.requests = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            # Loops that have been closed can no longer use (or close) their clients
+            for old_loop in [old for old in self._clients if old.is_closed()]:
+                del self._clients[old_loop]
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(
+                    connect=self.connect_timeout,
+                    read=self.read_timeout,
+                    write=self.connect_timeout,
+                    pool=self.pool_timeout,
+                ),
+                headers={"Content-Type": "application/json"},
+            )
+            self._clients[loop] = client
+        return client
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        token: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Send an authenticated request to the listing backend over the pooled client."""
+        self.requests += 1
+        return await self._get_client().request(
+            method,
+            path,
+            json=json,
+            params=params,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "open_clients": sum(not client.is_closed for client in self._clients.values()),
+            "http2": self.http2,
+        }
+
+    async def aclose(self):
+        """
+        Close every pooled client (call from the server's shutdown hook).
+
+        Each client is closed on its own loop: directly for the caller's loop,
+        via run_coroutine_threadsafe for loops running on other threads (such
+        as the sync tools' background loop). Clients of loops that are already
+        closed are just dropped.
+        """
+        current = asyncio.get_running_loop()
+        clients, self._clients = self._clients, {}
+        for loop, client in clients.items():
+            if client.is_closed:
+                continue
+            if loop is current:
+                await client.aclose()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+
+
+_client = ListingAPIClient()
+
+
+def get_listing_client() -> ListingAPIClient:
+    """Return the process-wide listing backend client."""
+    return _client
+
+
+def get_listing_client_stats() -> Dict[str, Any]:
+    """Counters for the process-wide listing backend client."""
+    return _client.stats()
+
+
+async def aclose_listing_client():
+    """Close the process-wide listing backend connections on every loop."""
+    await _client.aclose()
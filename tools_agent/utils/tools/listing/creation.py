@@ -2,17 +2,15 @@ import os
 import httpx
 import asyncio
 import logging
-from datetime import datetime
+import threading
 from typing import Optional, List, Dict, Any
-from langchain_core.tools import tool, InjectedToolArg
+from langchain_core.tools import InjectedToolArg, StructuredTool
 from langchain_core.runnables import RunnableConfig
 from typing_extensions import Annotated
+from .client import get_listing_client
 
 logger = logging.getLogger(__name__)
 
-# Configuration - Use your FastAPI backend
-API_BASE_URL = os.getenv("BASE_URL", "https://vesty-app-fastapi.onrender.com")
-
 #@tool
 def _get_user_context_from_config(config: Optional[RunnableConfig] = None) -> Dict[str, str]:
     """Extract user context from the RunnableConfig passed by LangGraph."""
@@ -97,64 +95,92 @@ async def _create_listing_with_auth(
         if zip_code:
             listing_data["zip_code"] = zip_code
 
-        # Use Supabase token for authentication
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {supabase_token}',
-        }
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{API_BASE_URL}/api/listings/",
-                headers=headers,
-                json=listing_data
-            )
-            
-            logger.info(f"FastAPI response status: {response.status_code}")
-            logger.info(f"FastAPI response text: {response.text}")
-            
-            if response.status_code == 200 or response.status_code == 201:
-                result = response.json()
-                return {
-                    "success": True,
-                    "listing": {
-                        "id": result.get("id"),
-                        "title": result.get("title"),
-                        "address": result.get("address"),
-                        "price": f"${result.get('price', 0):,.2f}",
-                        "bedrooms": result.get("bedrooms"),
-                        "bathrooms": result.get("bathrooms"),
-                        "sqft": result.get("sqft"),
-                        "property_type": result.get("property_type"),
-                        "image_count": len(result.get("images", [])) if result.get("images") else 0
-                    }
-                }
-            else:
-                error_detail = "Unknown error"
-                try:
-                    error_data = response.json()
-                    error_detail = error_data.get("detail", str(error_data))
-                except:
-                    error_detail = response.text or f"HTTP {response.status_code}"
-                
-                logger.error(f"FastAPI error: {error_detail}")
-                return {"success": False, "error": f"Backend error: {error_detail}"}
+        response = await get_listing_client().request(
+            "POST", "/api/listings/", supabase_token, json=listing_data
+        )
+        
+        logger.info(f"FastAPI response status: {response.status_code}")
+        logger.info(f"FastAPI response text: {response.text}")
+        
+        if response.status_code == 200 or response.status_code == 201:
+            return {"success": True, "listing": _listing_summary(response.json())}
+        else:
+            error_detail = _error_detail(response)
+            logger.error(f"FastAPI error: {error_detail}")
+            return {"success": False, "error": f"Backend error: {error_detail}"}
                 
     except Exception as e:
         logger.error(f"Error creating listing: {str(e)}")
         return {"success": False, "error": f"Failed to create listing: {str(e)}"}
 
-def _run_async(coro):
-    """Helper to run async functions safely."""
+def _listing_summary(result: Dict[str, Any]) -> Dict[str, Any]:
+    """The listing fields the tools report back to the user."""
+    return {
+        "id": result.get("id"),
+        "title": result.get("title"),
+        "address": result.get("address"),
+        "price": f"${result.get('price') or 0:,.2f}",
+        "bedrooms": result.get("bedrooms"),
+        "bathrooms": result.get("bathrooms"),
+        "sqft": result.get("sqft"),
+        "property_type": result.get("property_type"),
+        "image_count": len(result.get("images", [])) if result.get("images") else 0
+    }
+
+def _error_detail(response: httpx.Response) -> str:
     try:
-        loop = asyncio.get_event_loop()
+        error_data = response.json()
+        return error_data.get("detail", str(error_data))
+    except Exception:
+        return response.text or f"HTTP {response.status_code}"
+
+def _auth_from_config(config: Optional[RunnableConfig]):
+    """Return (user_context, supabase_token); the token is None when missing."""
+    user_context = _get_user_context_from_config(config)
+    supabase_token = config.get("configurable", {}).get("x-supabase-access-token")
+    if not supabase_token:
+        logger.error("No Supabase token found in config")
+    return user_context, supabase_token
+
+
+# One long-lived event loop on a daemon thread runs every sync tool call, so
+# sync callers share the pooled backend connections too and never need a loop
+# of their own
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(target=_sync_loop.run_forever, name="listing-sync", daemon=True).start()
+    return _sync_loop
+
+
+def _run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    The coroutine runs on the shared background loop and this thread waits for
+    the result. Waiting would stall an event loop running on this thread, so
+    that raises instead: async callers use the a* variants (or ainvoke).
+    """
+    try:
+        asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
+        return asyncio.run_coroutine_threadsafe(coro, _get_sync_loop()).result()
+    coro.close()
+    raise RuntimeError(
+        "Sync listing tools block the calling thread; from async code await "
+        "acreate_property_listing / aupdate_property_listing / aget_my_listings "
+        "or use ASYNC_LISTING_TOOLS with ainvoke"
+    )
+
 
 #@tool
-def create_property_listing(
+async def acreate_property_listing(
     title: str,
     address: str, 
     price: float,
@@ -172,19 +198,14 @@ def create_property_listing(
 ) -> str:
     """Create a new property listing using the FastAPI backend with proper authentication."""
     try:
-        # Get user context from LangGraph config
-        user_context = _get_user_context_from_config(config)
+        # Get user context and Supabase token from LangGraph config
+        user_context, supabase_token = _auth_from_config(config)
         logger.info(f"Creating listing for user: {user_context['user_id']}")
         
-        # Get Supabase token from config
-        configurable = config.get("configurable", {})
-        supabase_token = configurable.get("x-supabase-access-token")
-        
         if not supabase_token:
-            logger.error("No Supabase token found in config")
             return "❌ Authentication token not found. Please log in again."
         
-        result = _run_async(_create_listing_with_auth(
+        result = await _create_listing_with_auth(
             title=title, 
             address=address, 
             price=price,
@@ -200,7 +221,7 @@ def create_property_listing(
             city=city,
             state=state,
             zip_code=zip_code
-        ))
+        )
         
         if result["success"]:
             info = result["listing"]
@@ -221,8 +242,43 @@ def create_property_listing(
         logger.error(f"Unexpected error in create_property_listing: {e}")
         return f"❌ Unexpected error: {str(e)}"
 
+#@tool
+def create_property_listing(
+    title: str,
+    address: str, 
+    price: float,
+    bedrooms: Optional[int] = None,
+    bathrooms: Optional[float] = None,
+    sqft: Optional[int] = None,
+    property_type: Optional[str] = "house",
+    description: Optional[str] = None,
+    features: Optional[List[str]] = None,
+    images: Optional[List[str]] = None,
+    city: Optional[str] = None,
+    state: Optional[str] = None,
+    zip_code: Optional[str] = None,
+    config: Annotated[RunnableConfig, InjectedToolArg] = None
+) -> str:
+    """Create a new property listing using the FastAPI backend with proper authentication."""
+    return _run_sync(acreate_property_listing(
+        title=title,
+        address=address,
+        price=price,
+        bedrooms=bedrooms,
+        bathrooms=bathrooms,
+        sqft=sqft,
+        property_type=property_type,
+        description=description,
+        features=features,
+        images=images,
+        city=city,
+        state=state,
+        zip_code=zip_code,
+        config=config
+    ))
+
 #@tool 
-def update_property_listing(
+async def aupdate_property_listing(
     listing_id: str,
     title: Optional[str] = None,
     address: Optional[str] = None,
@@ -242,14 +298,64 @@ def update_property_listing(
     """Update an existing property listing via FastAPI backend."""
     return "Update listing functionality - placeholder implementation"
 
+#@tool 
+def update_property_listing(
+    listing_id: str,
+    title: Optional[str] = None,
+    address: Optional[str] = None,
+    price: Optional[float] = None,
+    bedrooms: Optional[int] = None,
+    bathrooms: Optional[float] = None,
+    sqft: Optional[int] = None,
+    property_type: Optional[str] = None,
+    description: Optional[str] = None,
+    features: Optional[List[str]] = None,
+    images: Optional[List[str]] = None,
+    city: Optional[str] = None,
+    state: Optional[str] = None,
+    zip_code: Optional[str] = None,
+    config: Annotated[RunnableConfig, InjectedToolArg] = None
+) -> str:
+    """Update an existing property listing via FastAPI backend."""
+    return _run_sync(aupdate_property_listing(
+        listing_id=listing_id,
+        title=title,
+        address=address,
+        price=price,
+        bedrooms=bedrooms,
+        bathrooms=bathrooms,
+        sqft=sqft,
+        property_type=property_type,
+        description=description,
+        features=features,
+        images=images,
+        city=city,
+        state=state,
+        zip_code=zip_code,
+        config=config
+    ))
+
 #@tool
-def get_my_listings(config: Annotated[RunnableConfig, InjectedToolArg] = None) -> str:
+async def aget_my_listings(config: Annotated[RunnableConfig, InjectedToolArg] = None) -> str:
     """Get all property listings for the current user via FastAPI backend."""
     return "Get listings functionality - placeholder implementation"
 
+#@tool
+def get_my_listings(config: Annotated[RunnableConfig, InjectedToolArg] = None) -> str:
+    """Get all property listings for the current user via FastAPI backend."""
+    return _run_sync(aget_my_listings(config=config))
+
 # Export tools for easy importing
 LISTING_TOOLS = [
     create_property_listing,
     update_property_listing, 
     get_my_listings
-]
\ No newline at end of file
+]
+
+# The same tools with native async implementations: ainvoke awaits the backend
+# call on the caller's event loop, invoke still works through the sync shims
+ASYNC_LISTING_TOOLS = [
+    StructuredTool.from_function(func=create_property_listing, coroutine=acreate_property_listing),
+    StructuredTool.from_function(func=update_property_listing, coroutine=aupdate_property_listing),
+    StructuredTool.from_function(func=get_my_listings, coroutine=aget_my_listings),
+]
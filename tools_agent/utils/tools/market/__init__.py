@@ -4,7 +4,7 @@
 from .research import market_trends
 
 # Import from valuation.py  
-from .valuation import generate_cma, quick_property_valuation
+from .valuation import generate_cma, generate_cma_batch, quick_property_valuation
 
 # Import from neighborhood_activity_tracker.py
 from .neighborhood_activity_tracker import neighborhood_activity_tracker
@@ -13,6 +13,7 @@ from .neighborhood_activity_tracker import neighborhood_activity_tracker
 __all__ = [
     "market_trends",
     "generate_cma", 
+    "generate_cma_batch",
     "quick_property_valuation",
     "neighborhood_activity_tracker"
 ]
\ No newline at end of file
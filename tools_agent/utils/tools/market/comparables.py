@@ -0,0 +1,160 @@
+"""
+Structured extraction of comparable-property facts from search results.
+
+One precompiled regex scans each snippet once and pulls out price, beds,
+baths, square footage and sold date together, so a CMA report parses every
+comparable exactly once and reuses the typed record everywhere it is shown.
+"""
+import re
+from datetime import date
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+PRICE_NOT_FOUND = "Price not found"
+
+# Alternatives are tried left to right at each position, so the "$" price
+# comes first (same precedence as extract_price_from_text: a "$" amount
+# anywhere beats a "450k" / "1.2 million" amount). Bare numbers are matched
+# once and classified by the unit that follows them; possessive quantifiers
+# stop the engine from re-trying every suffix of a digit run. Dates count as
+# the sale date when introduced by "sold", "closed" or "on"
+# ("Sold for $X on 3/1/2024"). Scale words must end a word, so "2 miles" and
+# "5 months" are not read as $2M / $5M. The leading lookahead skips positions
+# where no alternative can start.
+_COMPARABLE_RE = re.compile(
+    r"""
+    (?=[$\dsoc])
+    (?:
+        (?P<price>\$(?P<price_digits>[\d,]++(?:\.\d+)?+)(?P<price_suffix>[KkMm]?)
+            (?:\s*+(?P<price_scale>thousand|million)\b)?)
+      | (?<![\d,])(?P<number>\d[\d,]*+(?:\.\d+)?+)(?P<number_suffix>[KkMm]?)\s*+
+        (?:
+            (?P<price_words>thousand|million|k|m)\b
+          | (?P<sqft>sq\.?\s*f(?:ee)?t\.?|square\s+f(?:ee|oo)t|sf)\b
+          | (?P<beds>bedrooms?|beds?|bds?|br)\b
+          | (?P<baths>bathrooms?|baths?|ba)\b
+        )
+      | \b(?:sold|closed|on)\s+(?:on\s+)?(?P<sold_date>\d{1,2}/\d{1,2}/\d{2,4}
+            |(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(?:\d{1,2},?\s+)?\d{4})
+    )
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# Once these are found the rest of the snippet cannot change the record
+_ALL_FIELDS = frozenset({"price", "sqft", "beds", "baths", "sold_date"})
+_SCALE = {"k": 1e3, "thousand": 1e3, "m": 1e6, "million": 1e6}
+_MONTHS = {name: i for i, name in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1
+)}
+
+
+class Comparable(NamedTuple):
+    """One comparable property as parsed from a search result."""
+    title: str
+    url: str
+    snippet: str
+    source: str
+    price: Optional[float]
+    price_text: str
+    beds: Optional[float]
+    baths: Optional[float]
+    sqft: Optional[int]
+    sold_date: Optional[date]
+
+    def price_per_sqft(self, square_feet: Optional[int] = None) -> Optional[float]:
+        """Price divided by `square_feet` (default: the comparable's own size)."""
+        square_feet = square_feet if square_feet is not None else self.sqft
+        if self.price is None or not square_feet or square_feet <= 0:
+            return None
+        return self.price / square_feet
+
+
+def _to_number(digits: str, *scales: Optional[str]) -> Optional[float]:
+    digits = digits.replace(",", "")
+    if not digits or digits == ".":
+        return None
+    try:
+        value = float(digits)
+    except ValueError:
+        return None
+    for scale in scales:
+        if scale:
+            value *= _SCALE[scale.lower()]
+    return value
+
+
+def _parse_date(text: str) -> Optional[date]:
+    """Parse "3/14/2024", "3/14/24", "March 14, 2024" or "Mar 2024" (day defaults to 1)."""
+    try:
+        if "/" in text:
+            month, day, year = (int(part) for part in text.split("/"))
+            if year < 100:
+                year += 2000 if year < 70 else 1900
+        else:
+            parts = text.replace(",", " ").replace(".", " ").split()
+            month = _MONTHS[parts[0][:3].lower()]
+            day = int(parts[1]) if len(parts) == 3 else 1
+            year = int(parts[-1])
+        return date(year, month, day)
+    except (KeyError, ValueError):
+        return None
+
+
+def extract_comparable(title: str, url: str, snippet: str) -> Comparable:
+    """Parse a single search result into a Comparable in one pass over the snippet."""
+    found: Dict[str, re.Match] = {}
+    for match in _COMPARABLE_RE.finditer(snippet):
+        # lastgroup is the last named group closed: the alternative (or the
+        # unit after a bare number) that matched
+        kind = match.lastgroup
+        if kind not in found:
+            found[kind] = match
+            if found.keys() >= _ALL_FIELDS:
+                break
+
+    price = None
+    price_text = PRICE_NOT_FOUND
+    if "price" in found:
+        match = found["price"]
+        price_text = match.group("price")
+        price = _to_number(match.group("price_digits"), match.group("price_suffix"), match.group("price_scale"))
+    elif "price_words" in found:
+        match = found["price_words"]
+        price_text = match.group()
+        price = _to_number(match.group("number"), match.group("number_suffix"), match.group("price_words"))
+
+    beds = _to_number(found["beds"].group("number")) if "beds" in found else None
+    baths = _to_number(found["baths"].group("number")) if "baths" in found else None
+    sqft = None
+    if "sqft" in found:
+        sqft = int(_to_number(found["sqft"].group("number")) or 0) or None
+    sold_date = _parse_date(found["sold_date"].group("sold_date")) if "sold_date" in found else None
+
+    return Comparable(
+        title=title,
+        url=url,
+        snippet=snippet,
+        source=url.split("//")[-1].split("/")[0],
+        price=price,
+        price_text=price_text,
+        beds=beds,
+        baths=baths,
+        sqft=sqft,
+        sold_date=sold_date,
+    )
+
+
+def comparable_from_result(item: Dict[str, Any]) -> Comparable:
+    """Parse a search result dict (title / url / snippet) into a Comparable."""
+    return extract_comparable(item.get("title", ""), item.get("url", ""), item.get("snippet", ""))
+
+
+def parse_comparables(items: Iterable[Dict[str, Any]]) -> List[Comparable]:
+    """Parse every search result in `items`."""
+    return [comparable_from_result(item) for item in items]
+
+
+def format_price_per_sqft(comparable: Comparable, square_feet: int) -> str:
+    """Render price per square foot the way the reports show it ("$250/sqft" or "N/A")."""
+    value = comparable.price_per_sqft(square_feet)
+    return f"${value:.0f}/sqft" if value is not None else "N/A"
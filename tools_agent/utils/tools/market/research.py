@@ -1,10 +1,12 @@
 """
 Market research and trends analysis tools.
 """
-import aiohttp
 from typing import Annotated
 from langchain_core.tools import tool, ToolException
-from ..common.config import TAVILY_API_KEY, validate_tavily_api
+from ..common.config import (
+    TAVILY_CACHE_TTL_MARKET_TRENDS, TAVILY_CACHE_TTL_PROPERTY_DATA, validate_tavily_api
+)
+from ..common.tavily import TavilyAPIError, get_tavily_client
 
 #@tool(name="market_trends", description="Fetch local market research data for a specific location")
 async def market_trends(location: Annotated[str, "The location (city, state, or zip code) to fetch market trends for"]) -> dict:
@@ -13,41 +15,34 @@ async def market_trends(location: Annotated[str, "The location (city, state, or
     """
     validate_tavily_api()
     
-    url = "https://api.tavily.com/search"
-    headers = {
-        "Authorization": f"Bearer {TAVILY_API_KEY}",
-        "Content-Type": "application/json",
-    }
     payload = {
         "query": f"real estate market trends {location} 2024",
         "max_results": 5,
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status != 200:
-                    error_message = await response.text()
-                    raise ToolException(
-                        f"Failed to fetch market trends for {location}. "
-                        f"API responded with status {response.status}: {error_message}"
-                    )
-                data = await response.json()
-                # Extract only titles/snippets/links for brevity
-                results = [
-                    {
-                        "title": item.get("title", ""),
-                        "url": item.get("url", ""),
-                        "snippet": item.get("snippet", ""),
-                    }
-                    for item in data.get("results", [])
-                ]
-                summary = data.get("summary", "")
-                return {
-                    "location": location,
-                    "summary": summary,
-                    "top_results": results,
-                }
+        try:
+            data = await get_tavily_client().search(payload, cache_ttl=TAVILY_CACHE_TTL_MARKET_TRENDS)
+        except TavilyAPIError as e:
+            raise ToolException(
+                f"Failed to fetch market trends for {location}. "
+                f"API responded with status {e.status}: {e.body}"
+            )
+        # Extract only titles/snippets/links for brevity
+        results = [
+            {
+                "title": item.get("title", ""),
+                "url": item.get("url", ""),
+                "snippet": item.get("snippet", ""),
+            }
+            for item in data.get("results", [])
+        ]
+        summary = data.get("summary", "")
+        return {
+            "location": location,
+            "summary": summary,
+            "top_results": results,
+        }
     except Exception as e:
         raise ToolException(f"An error occurred fetching market trends: {str(e)}")
 
@@ -55,12 +50,6 @@ async def _search_property_data(query: str, max_results: int = 10) -> dict:
     """Search for property data using Tavily API with real estate focus."""
     validate_tavily_api()
     
-    url = "https://api.tavily.com/search"
-    headers = {
-        "Authorization": f"Bearer {TAVILY_API_KEY}",
-        "Content-Type": "application/json",
-    }
-    
     payload = {
         "query": query,
         "max_results": max_results,
@@ -69,12 +58,9 @@ async def _search_property_data(query: str, max_results: int = 10) -> dict:
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status != 200:
-                    error_message = await response.text()
-                    raise ToolException(f"Search failed with status {response.status}: {error_message}")
-                                
-                return await response.json()
+        try:
+            return await get_tavily_client().search(payload, cache_ttl=TAVILY_CACHE_TTL_PROPERTY_DATA)
+        except TavilyAPIError as e:
+            raise ToolException(f"Search failed with status {e.status}: {e.body}")
     except Exception as e:
         raise ToolException(f"Error searching property data: {str(e)}")
\ No newline at end of file
@@ -2,12 +2,66 @@
 Property valuation and CMA (Comparative Market Analysis) tools.
 """
 import asyncio
-from typing import Annotated
+import re
+from typing import Annotated, Any, AsyncIterator, Dict, List, Sequence, Tuple
 from datetime import datetime
 from langchain_core.tools import tool
-from ..common.utils import extract_price_from_text, calculate_price_per_sqft
+from ..common.config import CMA_BATCH_CONCURRENCY, VALUATION_COMPS_FILE
+from .comparables import Comparable, comparable_from_result, format_price_per_sqft, parse_comparables
+from .valuation_engine import estimate_value, load_comparables_fixture
 from .research import _search_property_data
 
+def _city_state(address: str) -> str:
+    """Extract the "City, ST" part of an address for location searches."""
+    location_parts = address.split(',')
+    if len(location_parts) >= 2:
+        return ','.join(location_parts[-2:]).strip()
+    return address
+
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def _words(text: str) -> str:
+    """Lowercase `text` to space-separated words, padded so " word " matches whole words."""
+    return f" {_NON_WORD.sub(' ', text.lower()).strip()} "
+
+
+def _comps_in_area(comparables: Sequence[Comparable], address: str) -> List[Comparable]:
+    """
+    Keep the comparables whose title, URL or snippet names the subject's city and state.
+
+    "123 Main St, Boise, ID 83702" keeps comps mentioning both "Boise" and "ID"
+    as whole words ("Boise-ID-83702" in a URL counts). Addresses without a
+    "City, ST" part match nothing.
+    """
+    parts = [part.strip() for part in address.split(',')]
+    if len(parts) < 3 or not parts[-2] or not parts[-1]:
+        return []
+    city, state = _words(parts[-2]), _words(parts[-1].split()[0])
+    return [
+        comp for comp in comparables
+        if city in (text := _words(f"{comp.title} {comp.url} {comp.snippet}")) and state in text
+    ]
+
+
+def _cma_search_queries(
+    address: str,
+    bedrooms: int,
+    bathrooms: float,
+    square_feet: int,
+    property_type: str,
+) -> List[str]:
+    """Search queries for a CMA: sold comps, size comps, market trends, active listings."""
+    city_state = _city_state(address)
+    return [
+        f"recently sold homes {city_state} {bedrooms} bedroom {bathrooms} bathroom {property_type}",
+        f"home sales {city_state} {square_feet} square feet comparable properties",
+        f"real estate market trends {city_state} 2024 home prices",
+        f"active listings {city_state} {bedrooms}br {bathrooms}ba for sale"
+    ]
+
+
 #@tool(name="generate_cma", description="Generate a comprehensive Comparative Market Analysis (CMA) report for a property")
 async def generate_cma(
     address: Annotated[str, "The subject property address"],
@@ -20,20 +74,7 @@ async def generate_cma(
     """Generate a comprehensive CMA report with comparable sales, market trends, and pricing analysis."""
     
     try:
-        # Extract location from address for searches
-        location_parts = address.split(',')
-        if len(location_parts) >= 2:
-            city_state = ','.join(location_parts[-2:]).strip()
-        else:
-            city_state = address
-        
-        # Create search queries for different data types
-        search_queries = [
-            f"recently sold homes {city_state} {bedrooms} bedroom {bathrooms} bathroom {property_type}",
-            f"home sales {city_state} {square_feet} square feet comparable properties",
-            f"real estate market trends {city_state} 2024 home prices",
-            f"active listings {city_state} {bedrooms}br {bathrooms}ba for sale"
-        ]
+        search_queries = _cma_search_queries(address, bedrooms, bathrooms, square_feet, property_type)
         
         # Execute searches concurrently
         search_results = await asyncio.gather(
@@ -41,36 +82,128 @@ async def generate_cma(
             return_exceptions=True
         )
         
-        # Process results
-        sold_properties = []
-        active_listings = []
-        market_trends = []
-        
-        for i, result in enumerate(search_results):
-            if isinstance(result, Exception):
-                continue
-                
-            for item in result.get("results", []):
-                property_data = {
-                    "title": item.get("title", ""),
-                    "url": item.get("url", ""),
-                    "snippet": item.get("snippet", ""),
-                    "price": extract_price_from_text(item.get("snippet", "")),
-                    "source": item.get("url", "").split("//")[-1].split("/")[0]
-                }
-                
-                # Categorize based on search query
-                if i == 0 and ("sold" in item.get("snippet", "").lower() or "sale" in item.get("title", "").lower()):
-                    sold_properties.append(property_data)
-                elif i == 3 and ("for sale" in item.get("snippet", "").lower() or "listing" in item.get("snippet", "").lower()):
-                    active_listings.append(property_data)
-                elif i == 2:
-                    market_trends.append(property_data)
-        
-        # Generate the CMA report
-        current_date = datetime.now().strftime("%B %d, %Y")
+        return _build_cma_report(
+            address, bedrooms, bathrooms, square_feet, property_type, radius_miles, search_results
+        )
         
-        cma_report = f"""
+    except Exception as e:
+        return f"❌ Error generating CMA report: {str(e)}"
+
+
+async def generate_cma_batch(
+    properties: Sequence[Dict[str, Any]],
+    max_concurrency: int = CMA_BATCH_CONCURRENCY,
+) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Generate CMA reports for many properties, yielding (index, report) as each finishes.
+
+    Each item in `properties` holds generate_cma's keyword arguments (address,
+    bedrooms, bathrooms, square_feet, optional property_type and radius_miles).
+    Identical searches across the batch, such as the per-city market-trends
+    query, run once and are shared by every report that needs them. At most
+    `max_concurrency` distinct searches are in flight at a time.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    searches: Dict[str, asyncio.Task] = {}
+
+    async def bounded_search(query: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await _search_property_data(query, 8)
+
+    def shared_search(query: str) -> asyncio.Future:
+        if query not in searches:
+            searches[query] = asyncio.create_task(bounded_search(query))
+        # Each report waits through its own shield: cancelling one report's
+        # gather must not cancel a search other reports are still waiting on
+        return asyncio.shield(searches[query])
+
+    async def run_one(index: int, subject: Dict[str, Any]) -> Tuple[int, str]:
+        try:
+            property_type = subject.get("property_type", "Single Family")
+            queries = _cma_search_queries(
+                subject["address"], subject["bedrooms"], subject["bathrooms"], subject["square_feet"], property_type
+            )
+            search_results = await asyncio.gather(
+                *[shared_search(query) for query in queries],
+                return_exceptions=True
+            )
+            return index, _build_cma_report(
+                subject["address"],
+                subject["bedrooms"],
+                subject["bathrooms"],
+                subject["square_feet"],
+                property_type,
+                subject.get("radius_miles", 1.0),
+                search_results,
+            )
+        except Exception as e:
+            return index, f"❌ Error generating CMA report: {str(e)}"
+
+    tasks = {asyncio.create_task(run_one(i, subject)): i for i, subject in enumerate(properties)}
+    pending = set(tasks)
+    try:
+        while pending:
+            finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                if task.cancelled():
+                    # One report was cancelled on its own; the rest of the batch carries on
+                    yield tasks[task], "❌ CMA report was cancelled"
+                else:
+                    yield task.result()
+    finally:
+        # Consumer stopped early (break, cancellation): drop the remaining work
+        for task in [*tasks, *searches.values()]:
+            task.cancel()
+
+
+def _format_specs(comp: Comparable) -> str:
+    """Short "3 BR | 2 BA | 1,850 sq ft | Sold Mar 14, 2024" line for a comparable."""
+    parts = []
+    if comp.beds is not None:
+        parts.append(f"{comp.beds:g} BR")
+    if comp.baths is not None:
+        parts.append(f"{comp.baths:g} BA")
+    if comp.sqft:
+        parts.append(f"{comp.sqft:,} sq ft")
+    if comp.sold_date:
+        parts.append(f"Sold {comp.sold_date:%b %d, %Y}")
+    return " | ".join(parts)
+
+
+def _build_cma_report(
+    address: str,
+    bedrooms: int,
+    bathrooms: float,
+    square_feet: int,
+    property_type: str,
+    radius_miles: float,
+    search_results: Sequence[Any],
+) -> str:
+    """Turn the four CMA search results (or exceptions) into the markdown report."""
+    # Process results
+    sold_properties = []
+    active_listings = []
+    market_trends = []
+    
+    for i, result in enumerate(search_results):
+        if isinstance(result, Exception):
+            continue
+            
+        for item in result.get("results", []):
+            snippet = item.get("snippet", "").lower()
+            
+            # Categorize based on search query; each kept result is parsed once
+            if i == 0 and ("sold" in snippet or "sale" in item.get("title", "").lower()):
+                sold_properties.append(comparable_from_result(item))
+            elif i == 3 and ("for sale" in snippet or "listing" in snippet):
+                active_listings.append(comparable_from_result(item))
+            elif i == 2:
+                market_trends.append(comparable_from_result(item))
+    
+    # Generate the CMA report
+    current_date = datetime.now().strftime("%B %d, %Y")
+    
+    cma_report = f"""
 # 🏠 COMPARATIVE MARKET ANALYSIS (CMA)
 
 **Property Address:** {address}  
@@ -96,49 +229,53 @@ This Comparative Market Analysis provides a comprehensive evaluation of the subj
 ## 🏘️ RECENTLY SOLD COMPARABLES
 
 """
-        
-        if sold_properties:
-            cma_report += "The following properties have sold recently in your area:\n\n"
-            for i, prop in enumerate(sold_properties[:6], 1):
-                price_per_sqft = calculate_price_per_sqft(prop["price"], square_feet)
-                cma_report += f"**{i}. {prop['title']}**\n"
-                cma_report += f"   💰 **Price:** {prop['price']}\n"
-                cma_report += f"   📐 **Price/SqFt:** {price_per_sqft}\n"
-                cma_report += f"   🔗 **Source:** {prop['source']}\n"
-                cma_report += f"   📝 **Details:** {prop['snippet'][:200]}...\n"
-                cma_report += f"   🌐 **Link:** {prop['url']}\n\n"
-        else:
-            cma_report += "No recent comparable sales found in the immediate area. Consider expanding the search radius.\n\n"
-        
-        cma_report += "---\n\n## 🏪 ACTIVE COMPETITION\n\n"
-        
-        if active_listings:
-            cma_report += "Current properties for sale in your area:\n\n"
-            for i, prop in enumerate(active_listings[:6], 1):
-                price_per_sqft = calculate_price_per_sqft(prop["price"], square_feet)
-                cma_report += f"**{i}. {prop['title']}**\n"
-                cma_report += f"   💰 **Asking Price:** {prop['price']}\n"
-                cma_report += f"   📐 **Price/SqFt:** {price_per_sqft}\n"
-                cma_report += f"   🔗 **Source:** {prop['source']}\n"
-                cma_report += f"   📝 **Details:** {prop['snippet'][:200]}...\n"
-                cma_report += f"   🌐 **Link:** {prop['url']}\n\n"
-        else:
-            cma_report += "Limited active listings found in the immediate area.\n\n"
-        
-        cma_report += "---\n\n## 📈 MARKET TRENDS\n\n"
-        
-        if market_trends:
-            cma_report += "Current market conditions and trends:\n\n"
-            for i, trend in enumerate(market_trends[:4], 1):
-                cma_report += f"**{i}. {trend['title']}**\n"
-                cma_report += f"   📊 **Insight:** {trend['snippet'][:250]}...\n"
-                cma_report += f"   🔗 **Source:** {trend['source']}\n"
-                cma_report += f"   🌐 **Link:** {trend['url']}\n\n"
-        else:
-            cma_report += "Market trend data not available for this specific area.\n\n"
-        
-        # Add pricing recommendations
-        cma_report += """---
+    
+    if sold_properties:
+        cma_report += "The following properties have sold recently in your area:\n\n"
+        for i, prop in enumerate(sold_properties[:6], 1):
+            cma_report += f"**{i}. {prop.title}**\n"
+            cma_report += f"   💰 **Price:** {prop.price_text}\n"
+            cma_report += f"   📐 **Price/SqFt:** {format_price_per_sqft(prop, square_feet)}\n"
+            specs = _format_specs(prop)
+            if specs:
+                cma_report += f"   🏠 **Specs:** {specs}\n"
+            cma_report += f"   🔗 **Source:** {prop.source}\n"
+            cma_report += f"   📝 **Details:** {prop.snippet[:200]}...\n"
+            cma_report += f"   🌐 **Link:** {prop.url}\n\n"
+    else:
+        cma_report += "No recent comparable sales found in the immediate area. Consider expanding the search radius.\n\n"
+    
+    cma_report += "---\n\n## 🏪 ACTIVE COMPETITION\n\n"
+    
+    if active_listings:
+        cma_report += "Current properties for sale in your area:\n\n"
+        for i, prop in enumerate(active_listings[:6], 1):
+            cma_report += f"**{i}. {prop.title}**\n"
+            cma_report += f"   💰 **Asking Price:** {prop.price_text}\n"
+            cma_report += f"   📐 **Price/SqFt:** {format_price_per_sqft(prop, square_feet)}\n"
+            specs = _format_specs(prop)
+            if specs:
+                cma_report += f"   🏠 **Specs:** {specs}\n"
+            cma_report += f"   🔗 **Source:** {prop.source}\n"
+            cma_report += f"   📝 **Details:** {prop.snippet[:200]}...\n"
+            cma_report += f"   🌐 **Link:** {prop.url}\n\n"
+    else:
+        cma_report += "Limited active listings found in the immediate area.\n\n"
+    
+    cma_report += "---\n\n## 📈 MARKET TRENDS\n\n"
+    
+    if market_trends:
+        cma_report += "Current market conditions and trends:\n\n"
+        for i, trend in enumerate(market_trends[:4], 1):
+            cma_report += f"**{i}. {trend.title}**\n"
+            cma_report += f"   📊 **Insight:** {trend.snippet[:250]}...\n"
+            cma_report += f"   🔗 **Source:** {trend.source}\n"
+            cma_report += f"   🌐 **Link:** {trend.url}\n\n"
+    else:
+        cma_report += "Market trend data not available for this specific area.\n\n"
+    
+    # Add pricing recommendations
+    cma_report += """---
 
 ## 💡 PRICING RECOMMENDATIONS
 
@@ -177,11 +314,8 @@ Based on the comparative analysis above, consider the following pricing strategi
 
 *Report generated on {current_date}*
 """
-        
-        return cma_report.strip()
-        
-    except Exception as e:
-        return f"❌ Error generating CMA report: {str(e)}"
+    
+    return cma_report.strip()
 
 #@tool(name="quick_property_valuation", description="Get a quick property value estimate based on comparable sales")
 async def quick_property_valuation(
@@ -193,32 +327,48 @@ async def quick_property_valuation(
     """Get a quick property valuation based on recent sales data."""
     
     try:
-        # Extract location for search
-        location_parts = address.split(',')
-        if len(location_parts) >= 2:
-            city_state = ','.join(location_parts[-2:]).strip()
+        if VALUATION_COMPS_FILE:
+            # Local fixture: reproducible and no search round-trip, but only
+            # meaningful for subjects in the area the file covers
+            comparables = _comps_in_area(load_comparables_fixture(VALUATION_COMPS_FILE), address)
+            if not comparables:
+                return (
+                    f"❌ The local comparables file ({VALUATION_COMPS_FILE}) has no sales in {_city_state(address)}. "
+                    "Unset VALUATION_COMPS_FILE to search live sales, or include the city and state in the address."
+                )
         else:
-            city_state = address
-        
-        # Search for recent sales
-        query = f"recently sold homes {city_state} {bedrooms} bedroom {bathrooms} bathroom {square_feet} square feet"
-        search_result = await _search_property_data(query, 5)
+            city_state = _city_state(address)
+            
+            # Search for recent sales
+            query = f"recently sold homes {city_state} {bedrooms} bedroom {bathrooms} bathroom {square_feet} square feet"
+            search_result = await _search_property_data(query, 5)
+            comparables = parse_comparables(search_result.get("results", []))
         
         valuation_text = f"🏠 **Quick Valuation for {address}**\n\n"
         valuation_text += f"**Property Details:** {bedrooms}BR | {bathrooms}BA | {square_feet:,} sq ft\n\n"
+        if VALUATION_COMPS_FILE:
+            valuation_text += f"**📁 Source:** local comparables file ({VALUATION_COMPS_FILE}), not live sales data\n\n"
         
-        if search_result.get("results"):
+        if comparables:
             valuation_text += "**📊 Based on Recent Comparable Sales:**\n\n"
             
-            for i, result in enumerate(search_result["results"][:5], 1):
-                price = extract_price_from_text(result.get("snippet", ""))
-                price_per_sqft = calculate_price_per_sqft(price, square_feet)
-                
-                valuation_text += f"{i}. **{result.get('title', 'Property')}**\n"
-                valuation_text += f"   💰 {price} | {price_per_sqft}\n"
-                valuation_text += f"   📝 {result.get('snippet', '')[:150]}...\n\n"
+            for i, comp in enumerate(comparables[:5], 1):
+                valuation_text += f"{i}. **{comp.title or 'Property'}**\n"
+                valuation_text += f"   💰 {comp.price_text} | {format_price_per_sqft(comp, square_feet)}\n"
+                valuation_text += f"   📝 {comp.snippet[:150]}...\n\n"
             
-            valuation_text += f"**💡 Estimated Value Range:** Based on comparable sales, your property may be valued between the range of prices shown above.\n\n"
+            estimate = estimate_value(comparables, square_feet, bedrooms, bathrooms)
+            if estimate:
+                valuation_text += (
+                    f"**💡 Estimated Value:** ${estimate.value:,.0f} "
+                    f"({estimate.confidence:.0%} confidence: ${estimate.low:,.0f} – ${estimate.high:,.0f})\n"
+                )
+                valuation_text += f"   📐 Weighted ${estimate.price_per_sqft:,.0f}/sqft across {estimate.comps_used} comparables"
+                if estimate.comps_dropped:
+                    valuation_text += f" ({estimate.comps_dropped} outlier{'s' if estimate.comps_dropped > 1 else ''} excluded)"
+                valuation_text += "\n\n"
+            else:
+                valuation_text += f"**💡 Estimated Value Range:** Based on comparable sales, your property may be valued between the range of prices shown above.\n\n"
             valuation_text += f"**⚠️ Note:** This is a preliminary estimate. For accurate valuation, order a professional appraisal or detailed CMA report."
         
         else:
@@ -0,0 +1,163 @@
+"""
+Numeric property valuation from parsed comparables.
+
+Comparables are packed into NumPy arrays and valued entirely with vectorized
+arithmetic: $/sqft per comp, outlier removal (Tukey fences, or a median
+absolute deviation check below four comps), similarity weights
+(size, beds, baths) and a weighted mean $/sqft with a normal-approximation
+confidence interval. NumPy is optional; without it estimate_value() returns
+None and callers fall back to listing the comparables.
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+from statistics import NormalDist
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from .comparables import Comparable, comparable_from_result
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Log size ratio at which a comp's weight falls to ~60% (about +/-25% in size)
+SIZE_BANDWIDTH = 0.25
+MIN_COMPS = 3
+# Modified z-score (0.6745 x deviation / MAD) above which a comp is an outlier
+# when there are too few comps for Tukey fences; the MAD is floored at
+# MIN_MAD_FRACTION of the median so near-identical comps don't make every
+# other one an outlier
+MAD_Z_CUTOFF = 3.5
+MIN_MAD_FRACTION = 0.05
+# Below this effective sample size the weights rest on one or two comps and the
+# weighted variance is meaningless (a lone comp gives a zero-width interval)
+MIN_EFFECTIVE_N = 2.0
+# Total raw similarity weight required: an exact match weighs 1, so every comp
+# being far from the subject's size (twice the size weighs ~0.02) yields no estimate
+MIN_WEIGHT_MASS = 1.0
+# The interval is never narrower than +/- this fraction of the estimate
+MIN_MARGIN_FRACTION = 0.05
+
+
+class ValuationEstimate(NamedTuple):
+    value: float
+    low: float
+    high: float
+    price_per_sqft: float
+    confidence: float
+    comps_used: int
+    comps_dropped: int
+
+
+def comparables_to_arrays(comparables: Sequence[Comparable]):
+    """
+    Return (price, sqft, beds, baths) float64 arrays for comps with a price and size.
+
+    Missing beds/baths are NaN.
+    """
+    usable = [c for c in comparables if c.price and c.sqft]
+    price = np.fromiter((c.price for c in usable), dtype=np.float64, count=len(usable))
+    sqft = np.fromiter((c.sqft for c in usable), dtype=np.float64, count=len(usable))
+    beds = np.fromiter((np.nan if c.beds is None else c.beds for c in usable), dtype=np.float64, count=len(usable))
+    baths = np.fromiter((np.nan if c.baths is None else c.baths for c in usable), dtype=np.float64, count=len(usable))
+    return price, sqft, beds, baths
+
+
+def _inlier_mask(values: "np.ndarray") -> "np.ndarray":
+    """
+    Keep values within 1.5 IQR of the quartiles (Tukey fences, 4+ values).
+
+    Fences need four values, so smaller samples keep values whose modified
+    z-score against the median is at most MAD_Z_CUTOFF.
+    """
+    if values.size < 4:
+        median = np.median(values) if values.size else 0.0
+        deviation = np.abs(values - median)
+        mad = max(float(np.median(deviation)) if values.size else 0.0, MIN_MAD_FRACTION * abs(median))
+        if mad == 0.0:
+            return np.ones(values.size, dtype=bool)
+        return 0.6745 * deviation / mad <= MAD_Z_CUTOFF
+    q1, q3 = np.percentile(values, [25, 75])
+    spread = 1.5 * (q3 - q1)
+    return (values >= q1 - spread) & (values <= q3 + spread)
+
+
+def estimate_value(
+    comparables: Sequence[Comparable],
+    square_feet: int,
+    bedrooms: Optional[float] = None,
+    bathrooms: Optional[float] = None,
+    confidence: float = 0.90,
+    min_comps: int = MIN_COMPS,
+) -> Optional[ValuationEstimate]:
+    """
+    Estimate the subject's value as square_feet x similarity-weighted mean $/sqft.
+
+    Returns None when NumPy is unavailable, fewer than `min_comps` comps
+    with both a price and a size survive outlier removal, or the similarity
+    weights say the comps are too unlike the subject (total weight below
+    MIN_WEIGHT_MASS) or rest on too few of them (effective n below
+    MIN_EFFECTIVE_N). The interval is at least +/- MIN_MARGIN_FRACTION of
+    the estimate wide.
+    """
+    if not NUMPY_AVAILABLE or square_feet <= 0:
+        return None
+
+    price, sqft, beds, baths = comparables_to_arrays(comparables)
+    ppsf = price / sqft
+    keep = _inlier_mask(ppsf)
+    if keep.sum() < min_comps:
+        return None
+    dropped = int(keep.size - keep.sum())
+    ppsf, sqft, beds, baths = ppsf[keep], sqft[keep], beds[keep], baths[keep]
+
+    # Closer in size, bedrooms and bathrooms => more weight; unknown counts are neutral
+    weights = np.exp(-0.5 * (np.log(sqft / square_feet) / SIZE_BANDWIDTH) ** 2)
+    if bedrooms is not None:
+        weights /= 1.0 + np.nan_to_num(np.abs(beds - bedrooms), nan=0.0)
+    if bathrooms is not None:
+        weights /= 1.0 + np.nan_to_num(np.abs(baths - bathrooms), nan=0.0)
+    total = weights.sum()
+    if not total >= MIN_WEIGHT_MASS:
+        return None
+    weights /= total
+
+    effective_n = 1.0 / float(weights @ weights)
+    if effective_n < MIN_EFFECTIVE_N:
+        return None
+    mean = float(weights @ ppsf)
+    variance = float(weights @ (ppsf - mean) ** 2)
+    # Unbiased weighted variance over the effective sample size, then SE of the mean
+    standard_error = (variance / max(effective_n - 1.0, 1.0)) ** 0.5
+    margin = max(NormalDist().inv_cdf(0.5 + confidence / 2) * standard_error, MIN_MARGIN_FRACTION * mean)
+
+    return ValuationEstimate(
+        value=mean * square_feet,
+        low=max(mean - margin, 0.0) * square_feet,
+        high=(mean + margin) * square_feet,
+        price_per_sqft=mean,
+        confidence=confidence,
+        comps_used=int(ppsf.size),
+        comps_dropped=dropped,
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_fixture(path: str, mtime_ns: int) -> List[Comparable]:
+    with open(path, encoding="utf-8") as f:
+        data: Any = json.load(f)
+    items = data.get("results", []) if isinstance(data, dict) else data
+    return [comparable_from_result(item) for item in items]
+
+
+def load_comparables_fixture(path) -> List[Comparable]:
+    """
+    Load comparables from a local JSON file of search results.
+
+    The file holds either a Tavily-style {"results": [...]} object or a bare
+    list of {"title", "url", "snippet"} items. Parsed once per file version.
+    """
+    path = Path(path).expanduser()
+    return _load_fixture(str(path), path.stat().st_mtime_ns)
@@ -0,0 +1,188 @@
+"""
+Professional business cards built from search results.
+
+extract_card() runs the precompiled common/patterns.py chains (the same ones
+behind the common/utils.py extractors) once per field and keeps the parsed
+rating alongside its display form, so finders, the directory and dedup all
+work from one ProfessionalCard record instead of re-parsing display strings.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..common.patterns import ADDRESS, PHONE, RATING
+from ..common.utils import extract_business_name, format_address, format_rating
+
+NO_PHONE = "📞 Call for info"
+NO_ADDRESS = "📍 Address on website"
+NO_RATING = "⭐ Not rated yet"
+DEFAULT_NAME = "Professional Service"
+
+# Tokens that don't tell two businesses apart: legal suffixes, connectives and
+# the source-site words left in titles like "Smith Law Firm - Home | Facebook"
+_NAME_NOISE = frozenset({
+    "llc", "inc", "pllc", "pc", "pa", "llp", "co", "corp", "ltd", "the", "and", "of", "firm",
+    "home", "reviews", "review", "profile", "yelp", "bbb", "facebook", "linkedin", "google",
+    "yellowpages", "thumbtack", "angi", "angieslist", "homeadvisor", "avvo",
+})
+_NAME_TOKEN = re.compile(r"[a-z0-9]+")
+_DIGITS = re.compile(r"\d")
+
+
+class ProfessionalCard:
+    """A professional's contact card; supports card["name"] for dict-style callers."""
+
+    __slots__ = ("name", "address", "phone", "rating", "url", "snippet", "domain", "rating_value", "sources")
+
+    def __init__(
+        self,
+        name: str,
+        address: str,
+        phone: str,
+        rating: str,
+        url: str,
+        snippet: str,
+        domain: str,
+        rating_value: Optional[float] = None,
+        sources: Tuple[str, ...] = (),
+    ):
+        self.name = name
+        self.address = address
+        self.phone = phone
+        self.rating = rating
+        self.url = url
+        self.snippet = snippet
+        self.domain = domain
+        self.rating_value = rating_value
+        # Domains of every search result merged into this card
+        self.sources = sources or ((domain,) if domain else ())
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, str]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"ProfessionalCard(name={self.name!r}, phone={self.phone!r}, domain={self.domain!r})"
+
+
+def extract_card(title: str, url: str, snippet: str) -> ProfessionalCard:
+    """Build a ProfessionalCard from one search result (same fields as the common/utils.py extractors)."""
+    phone = PHONE.first(snippet)
+    address = ADDRESS.first(snippet)
+    rating = RATING.first(snippet)
+    rating_value = float(rating) if rating is not None else None
+
+    return ProfessionalCard(
+        name=extract_business_name(title, snippet),
+        address=format_address(address) if address is not None else NO_ADDRESS,
+        phone=phone.strip() if phone is not None else NO_PHONE,
+        rating=format_rating(rating_value) if rating_value is not None else NO_RATING,
+        url=url,
+        snippet=snippet,
+        domain=url.split("//")[-1].split("/")[0] if url else "",
+        rating_value=rating_value,
+    )
+
+
+def extract_cards(items: Iterable[Dict]) -> List[ProfessionalCard]:
+    """Extract a card for every search result (dicts with title / url / snippet)."""
+    return [extract_card(item.get("title", ""), item.get("url", ""), item.get("snippet", "")) for item in items]
+
+
+def normalize_name(name: str) -> str:
+    """
+    Fuzzy business-name key: casefolded, "&" read as "and", punctuation,
+    legal suffixes and source-site words dropped, remaining tokens sorted.
+
+    "Smith & Jones Law, PLLC" and "Jones and Smith Law - Facebook" both give "jones law smith".
+    """
+    tokens = _NAME_TOKEN.findall(name.casefold().replace("&", " and "))
+    return " ".join(sorted(token for token in tokens if token not in _NAME_NOISE))
+
+
+def normalize_phone(phone: str) -> Optional[str]:
+    """Ten-digit phone key ("(512) 555-1234", "+1 512.555.1234" -> "5125551234"), or None."""
+    digits = "".join(_DIGITS.findall(phone))
+    if len(digits) == 11 and digits[0] == "1":
+        digits = digits[1:]
+    return digits if len(digits) == 10 else None
+
+
+def card_keys(card: ProfessionalCard) -> Set[str]:
+    """
+    Dedup keys for a card: its normalized name and phone (placeholders excluded).
+
+    Single-token names ("Company", "Attorney") are too generic to identify a
+    business on their own, so only the phone can match those.
+    """
+    keys = set()
+    name = normalize_name(card.name) if card.name != DEFAULT_NAME else ""
+    if " " in name:
+        keys.add("name:" + name)
+    if card.phone != NO_PHONE:
+        phone = normalize_phone(card.phone)
+        if phone:
+            keys.add("phone:" + phone)
+    return keys
+
+
+def merge_cards(cards: Iterable[ProfessionalCard]) -> List[ProfessionalCard]:
+    """
+    Cluster cards for the same business and merge each cluster into one card.
+
+    Cards sharing a normalized name or phone are one business (transitively,
+    so a Yelp card matched by name and a BBB card matched by phone end up
+    together). Clusters keep the position of their first card. The merged
+    card takes the first card's URL and first specific name, fills a missing address or
+    phone from the others, averages the ratings and lists every source domain.
+    """
+    cards = list(cards)
+    parent = list(range(len(cards)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owner: Dict[str, int] = {}
+    for i, card in enumerate(cards):
+        for key in card_keys(card):
+            if key in owner:
+                a, b = find(owner[key]), find(i)
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+            else:
+                owner[key] = i
+
+    clusters: Dict[int, List[ProfessionalCard]] = {}
+    for i, card in enumerate(cards):
+        clusters.setdefault(find(i), []).append(card)
+    return [_merge_cluster(cluster) for cluster in clusters.values()]
+
+
+def _merge_cluster(cluster: List[ProfessionalCard]) -> ProfessionalCard:
+    if len(cluster) == 1:
+        return cluster[0]
+    first = cluster[0]
+    name = next((c.name for c in cluster if c.name != DEFAULT_NAME), first.name)
+    address = next((c.address for c in cluster if c.address != NO_ADDRESS), NO_ADDRESS)
+    phone = next((c.phone for c in cluster if c.phone != NO_PHONE), NO_PHONE)
+    ratings = [c.rating_value for c in cluster if c.rating_value is not None]
+    rating_value = round(sum(ratings) / len(ratings), 1) if ratings else None
+    sources = tuple(dict.fromkeys(domain for c in cluster for domain in c.sources))
+    return ProfessionalCard(
+        name=name,
+        address=address,
+        phone=phone,
+        rating=format_rating(rating_value) if rating_value is not None else NO_RATING,
+        url=first.url,
+        snippet=first.snippet,
+        domain=first.domain,
+        rating_value=rating_value,
+        sources=sources,
+    )
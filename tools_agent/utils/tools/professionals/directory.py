@@ -0,0 +1,230 @@
+"""
+Local directory index of professionals found by past searches.
+
+Every card returned by a professional search is stored in SQLite, keyed by
+normalized profession and location, with an FTS5 index over the name and
+snippet for free-text search(). Finders query the directory first and only go to Tavily
+for a profession/location that has never been searched; entries older than
+the refresh interval are served immediately and re-searched in the background.
+Results are ranked by rating, then by when the business was last seen.
+"""
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from ..common.config import PROFESSIONAL_DIRECTORY_DB, PROFESSIONAL_DIRECTORY_MAX_AGE
+from .cards import ProfessionalCard
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+_CARD_COLUMNS = ("name", "address", "phone", "rating", "url", "snippet", "domain", "rating_value")
+_SELECT_CARD = f"SELECT {', '.join('b.' + c for c in _CARD_COLUMNS)}, b.sources"
+
+# PRAGMA user_version of the current schema: 1 added businesses.sources and
+# dropped profession from the FTS index
+_SCHEMA_VERSION = 1
+
+
+def normalize_key(text: str) -> str:
+    """Normalize a location or profession: "Austin, TX" and " AUSTIN,TX " both map to "austin tx"."""
+    return " ".join(_NON_WORD.sub(" ", text.casefold()).split())
+
+
+def _fts_phrase(text: str) -> str:
+    """Quote `text` as a single FTS5 phrase (punctuation dropped, quotes escaped)."""
+    return '"' + normalize_key(text).replace('"', '""') + '"'
+
+
+def _business_key(card: ProfessionalCard) -> str:
+    return card.url or f"{card.name.casefold()}|{card.domain}"
+
+
+def _card_from_row(row: tuple) -> ProfessionalCard:
+    *fields, sources = row
+    return ProfessionalCard(*fields, sources=tuple(sources.split()) if sources else ())
+
+
+class ProfessionalDirectory:
+    """Blocking SQLite store (including construction); called from worker threads via asyncio.to_thread."""
+
+    def __init__(self, path: Path, max_age: float = PROFESSIONAL_DIRECTORY_MAX_AGE):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._lock:
+            self._migrate()
+            self._create_schema()
+
+    def _migrate(self):
+        """Bring a directory written by an older version up to the current schema."""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(businesses)")}
+        if columns and "sources" not in columns:
+            self._conn.execute("ALTER TABLE businesses ADD COLUMN sources TEXT")
+        # The FTS index used to cover profession too; drop it and let
+        # _create_schema rebuild it from the businesses table
+        self._conn.executescript(
+            """
+            DROP TRIGGER IF EXISTS businesses_ai;
+            DROP TRIGGER IF EXISTS businesses_ad;
+            DROP TRIGGER IF EXISTS businesses_au;
+            DROP TABLE IF EXISTS businesses_fts;
+            """
+        )
+
+    def _create_schema(self):
+        rebuild_fts = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'businesses_fts'"
+        ).fetchone() is None
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS businesses (
+                id INTEGER PRIMARY KEY,
+                profession TEXT NOT NULL,
+                location TEXT NOT NULL,
+                key TEXT NOT NULL,
+                name TEXT, address TEXT, phone TEXT, rating TEXT, url TEXT, snippet TEXT, domain TEXT,
+                rating_value REAL,
+                sources TEXT,
+                updated_at REAL NOT NULL,
+                UNIQUE (profession, location, key)
+            );
+            CREATE TABLE IF NOT EXISTS searches (
+                profession TEXT NOT NULL,
+                location TEXT NOT NULL,
+                searched_at REAL NOT NULL,
+                PRIMARY KEY (profession, location)
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS businesses_fts USING fts5(
+                name, snippet, content='businesses', content_rowid='id'
+            );
+            CREATE TRIGGER IF NOT EXISTS businesses_ai AFTER INSERT ON businesses BEGIN
+                INSERT INTO businesses_fts(rowid, name, snippet) VALUES (new.id, new.name, new.snippet);
+            END;
+            CREATE TRIGGER IF NOT EXISTS businesses_ad AFTER DELETE ON businesses BEGIN
+                INSERT INTO businesses_fts(businesses_fts, rowid, name, snippet)
+                VALUES ('delete', old.id, old.name, old.snippet);
+            END;
+            CREATE TRIGGER IF NOT EXISTS businesses_au AFTER UPDATE ON businesses BEGIN
+                INSERT INTO businesses_fts(businesses_fts, rowid, name, snippet)
+                VALUES ('delete', old.id, old.name, old.snippet);
+                INSERT INTO businesses_fts(rowid, name, snippet) VALUES (new.id, new.name, new.snippet);
+            END;
+            """
+        )
+        if rebuild_fts:
+            self._conn.execute("INSERT INTO businesses_fts(businesses_fts) VALUES ('rebuild')")
+        self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def lookup(self, profession: str, location: str, limit: int = 8) -> Tuple[List[ProfessionalCard], Optional[float]]:
+        """
+        Return (cards, searched_at) for a profession in a location.
+
+        Cards are ranked by rating (unrated last), then most recently seen.
+        searched_at is None when this profession/location was never searched.
+        """
+        profession, location = normalize_key(profession), normalize_key(location)
+        with self._lock:
+            searched = self._conn.execute(
+                "SELECT searched_at FROM searches WHERE profession = ? AND location = ?",
+                (profession, location),
+            ).fetchone()
+            if searched is None:
+                return [], None
+            rows = self._conn.execute(
+                f"{_SELECT_CARD} FROM businesses b WHERE b.profession = ? AND b.location = ?"
+                " ORDER BY b.rating_value IS NULL, b.rating_value DESC, b.updated_at DESC LIMIT ?",
+                (profession, location, limit),
+            ).fetchall()
+        return [_card_from_row(row) for row in rows], searched[0]
+
+    def search(self, text: str, location: Optional[str] = None, limit: int = 8) -> List[ProfessionalCard]:
+        """Full-text search over the name and snippet of every stored business."""
+        query = " AND ".join(_fts_phrase(word) for word in normalize_key(text).split())
+        if not query:
+            return []
+        sql = (
+            f"{_SELECT_CARD} FROM businesses_fts"
+            " JOIN businesses b ON b.id = businesses_fts.rowid WHERE businesses_fts MATCH ?"
+        )
+        params: list = [query]
+        if location:
+            sql += " AND b.location = ?"
+            params.append(normalize_key(location))
+        sql += " ORDER BY b.rating_value IS NULL, b.rating_value DESC, b.updated_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [_card_from_row(row) for row in rows]
+
+    def store(self, profession: str, location: str, cards: Sequence[ProfessionalCard]):
+        """
+        Record a search's cards and mark the profession/location as searched now.
+
+        Businesses not seen by any search within max_age are dropped.
+        """
+        profession, location = normalize_key(profession), normalize_key(location)
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO businesses"
+                    " (profession, location, key, name, address, phone, rating, url, snippet, domain, rating_value,"
+                    " sources, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT (profession, location, key) DO UPDATE SET"
+                    " name = excluded.name, address = excluded.address, phone = excluded.phone,"
+                    " rating = excluded.rating, url = excluded.url, snippet = excluded.snippet,"
+                    " domain = excluded.domain, rating_value = excluded.rating_value,"
+                    " sources = excluded.sources, updated_at = excluded.updated_at",
+                    [
+                        (
+                            profession, location, _business_key(card), *(getattr(card, c) for c in _CARD_COLUMNS),
+                            " ".join(card.sources), now,
+                        )
+                        for card in cards
+                    ],
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO searches VALUES (?, ?, ?)", (profession, location, now)
+                )
+                self._conn.execute(
+                    "DELETE FROM businesses WHERE profession = ? AND location = ? AND updated_at < ?",
+                    (profession, location, now - self.max_age),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_directory: Optional[ProfessionalDirectory] = None
+_directory_lock = threading.Lock()
+
+
+def get_professional_directory() -> Optional[ProfessionalDirectory]:
+    """
+    Return the process-wide directory, or None when PROFESSIONAL_DIRECTORY_DB is unset.
+
+    The first call opens the database and creates the schema, so async code
+    calls this through asyncio.to_thread too.
+    """
+    global _directory
+    if _directory is None and PROFESSIONAL_DIRECTORY_DB:
+        with _directory_lock:
+            if _directory is None:
+                _directory = ProfessionalDirectory(PROFESSIONAL_DIRECTORY_DB)
+    return _directory
@@ -1,14 +1,50 @@
 """
 Professional service finder tools for real estate transactions.
 """
-import aiohttp
-from typing import Annotated, Dict, List
+import asyncio
+import logging
+import time
+from typing import Annotated, Dict, List, NamedTuple, Optional, Tuple
 from langchain_core.tools import tool, ToolException
-from ..common.config import TAVILY_API_KEY, validate_tavily_api
-from ..common.utils import (
-    extract_business_name, extract_phone, extract_address, extract_rating, 
-    format_professional_card
-)
+from ..common.config import PROFESSIONAL_DIRECTORY_REFRESH, TAVILY_CACHE_TTL_PROFESSIONALS, validate_tavily_api
+from ..common.tavily import TavilyAPIError, get_tavily_client
+from ..common.utils import format_professional_card
+from .cards import ProfessionalCard, card_keys, extract_card, merge_cards
+from .directory import ProfessionalDirectory, get_professional_directory, normalize_key
+
+logger = logging.getLogger(__name__)
+
+
+class ProfessionSearch(NamedTuple):
+    title: str
+    profession: str
+    keywords: str
+
+
+# Search terms for each profession, shared by the single finders and find_closing_team
+PROFESSION_SEARCHES: Dict[str, ProfessionSearch] = {
+    "attorney": ProfessionSearch(
+        "Real Estate Attorneys", "real estate attorney lawyer", "property law closing contract residential"
+    ),
+    "title_company": ProfessionSearch(
+        "Title Companies", "title company escrow", "real estate closing settlement insurance"
+    ),
+    "inspector": ProfessionSearch(
+        "Home Inspectors", "home inspector inspection", "certified property structural mechanical"
+    ),
+    "appraiser": ProfessionSearch(
+        "Real Estate Appraisers", "real estate appraiser", "certified residential property valuation"
+    ),
+    "lender": ProfessionSearch(
+        "Mortgage Lenders", "mortgage lender bank", "home loan residential financing"
+    ),
+    "photographer": ProfessionSearch(
+        "Real Estate Photographers", "real estate photographer photography", "property listing photos drone aerial"
+    ),
+}
+
+CLOSING_TEAM_ROLES = ("attorney", "title_company", "inspector", "appraiser")
+CLOSING_TEAM_PER_ROLE = 3
 
 
 async def _search_professionals(
@@ -17,14 +53,45 @@ async def _search_professionals(
     additional_keywords: str = "",
     max_results: int = 8
 ) -> Dict:
-    """Enhanced search for real estate professionals with better filtering."""
-    validate_tavily_api()
-    
-    url = "https://api.tavily.com/search"
-    headers = {
-        "Authorization": f"Bearer {TAVILY_API_KEY}",
-        "Content-Type": "application/json",
+    """
+    Enhanced search for real estate professionals with better filtering.
+
+    With the local directory enabled, a profession/location searched before
+    is answered from the directory (no network I/O) and refreshed in the
+    background once older than PROFESSIONAL_DIRECTORY_REFRESH.
+    """
+    directory = await asyncio.to_thread(get_professional_directory)
+    if directory is not None:
+        cards, searched_at = await asyncio.to_thread(directory.lookup, profession, location, max_results)
+        # Refreshes can index a business again under another source's URL
+        cards = merge_cards(cards)
+        if cards:
+            if time.time() - searched_at > PROFESSIONAL_DIRECTORY_REFRESH:
+                _refresh_directory(directory, profession, location, max_results)
+            return {
+                "location": location,
+                "profession": profession,
+                "results": cards[:6],
+                "total_found": len(cards)
+            }
+
+    results = await _fetch_professionals(profession, location, max_results)
+    if directory is not None:
+        await asyncio.to_thread(directory.store, profession, location, results)
+        # Same order the directory will answer with next time
+        results.sort(key=lambda card: (card.rating_value is None, -(card.rating_value or 0.0)))
+
+    return {
+        "location": location,
+        "profession": profession,
+        "results": results[:6],  # Limit to top 6 results
+        "total_found": len(results)
     }
+
+
+async def _fetch_professionals(profession: str, location: str, max_results: int = 8) -> List[ProfessionalCard]:
+    """Search Tavily and extract a card for every business listing in the results."""
+    validate_tavily_api()
     
     # More specific query to get actual business listings
     query = f'"{profession}" "{location}" contact phone address reviews -"search" -"find" -"best of"'
@@ -40,56 +107,62 @@ async def _search_professionals(
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status != 200:
-                    error_message = await response.text()
-                    raise ToolException(f"Search failed: {error_message}")
-                
-                data = await response.json()
-                results = []
-                
-                for item in data.get("results", []):
-                    # Filter out generic search pages
-                    title = item.get("title", "")
-                    url_str = item.get("url", "")
-                    snippet = item.get("snippet", "")
-                    
-                    # Skip if it's a search results page
-                    if any(word in title.lower() for word in ["search", "find", "best of", "top 10"]):
-                        continue
-                    if "search?" in url_str or "/search" in url_str:
-                        continue
-                    
-                    # Extract business information
-                    business_name = extract_business_name(title, snippet)
-                    phone = extract_phone(snippet)
-                    address = extract_address(snippet)
-                    rating = extract_rating(snippet)
-                    
-                    if business_name and business_name != "Unknown Business":
-                        result = {
-                            "name": business_name,
-                            "address": address,
-                            "phone": phone,
-                            "rating": rating,
-                            "url": url_str,
-                            "snippet": snippet,
-                            "domain": url_str.split("//")[-1].split("/")[0] if url_str else ""
-                        }
-                        results.append(result)
-                
-                return {
-                    "location": location,
-                    "profession": profession,
-                    "results": results[:6],  # Limit to top 6 results
-                    "total_found": len(results)
-                }
+        try:
+            data = await get_tavily_client().search(payload, cache_ttl=TAVILY_CACHE_TTL_PROFESSIONALS)
+        except TavilyAPIError as e:
+            raise ToolException(f"Search failed: {e.body}")
+
+        results = []
+        
+        for item in data.get("results", []):
+            # Filter out generic search pages
+            title = item.get("title", "")
+            url_str = item.get("url", "")
+            snippet = item.get("snippet", "")
+            
+            # Skip if it's a search results page
+            if any(word in title.lower() for word in ["search", "find", "best of", "top 10"]):
+                continue
+            if "search?" in url_str or "/search" in url_str:
+                continue
+            
+            # Extract business information
+            card = extract_card(title, url_str, snippet)
+            if card.name and card.name != "Unknown Business":
+                results.append(card)
+        
+        # The same business often comes back from several sites (Yelp, BBB, Facebook)
+        return merge_cards(results)
                 
     except Exception as e:
         raise ToolException(f"Search error: {str(e)}")
 
 
+# Background directory refreshes in flight, one per profession/location
+_refreshes: Dict[Tuple[str, str], asyncio.Task] = {}
+
+
+def _refresh_directory(directory: ProfessionalDirectory, profession: str, location: str, max_results: int):
+    """Re-search a stale profession/location in the background and update the directory."""
+    key = (normalize_key(profession), normalize_key(location))
+    if key in _refreshes:
+        return
+
+    async def refresh():
+        results = await _fetch_professionals(profession, location, max_results)
+        await asyncio.to_thread(directory.store, profession, location, results)
+
+    task = asyncio.create_task(refresh())
+    _refreshes[key] = task
+    task.add_done_callback(lambda done: _refresh_done(key, done))
+
+
+def _refresh_done(key: Tuple[str, str], task: asyncio.Task):
+    _refreshes.pop(key, None)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background directory refresh failed for {key}: {task.exception()}")
+
+
 def _format_chatbot_response(title: str, location: str, results: List[Dict], tips: List[str]) -> str:
     """Format response for chatbot with clean professional cards."""
     
@@ -133,10 +206,11 @@ Found {len(results)} qualified professionals:
 async def find_real_estate_attorney(location: Annotated[str, "City and state to search for attorneys"]) -> str:
     """Find local real estate attorneys for legal assistance with property transactions."""
     try:
+        search = PROFESSION_SEARCHES["attorney"]
         data = await _search_professionals(
-            "real estate attorney lawyer", 
+            search.profession, 
             location, 
-            "property law closing contract residential"
+            search.keywords
         )
         
         tips = [
@@ -147,7 +221,7 @@ async def find_real_estate_attorney(location: Annotated[str, "City and state to
         ]
         
         return _format_chatbot_response(
-            "Real Estate Attorneys", 
+            search.title, 
             location, 
             data["results"], 
             tips
@@ -161,10 +235,11 @@ async def find_real_estate_attorney(location: Annotated[str, "City and state to
 async def find_real_estate_photographer(location: Annotated[str, "City and state to search for photographers"]) -> str:
     """Find local real estate photographers for property listing photos."""
     try:
+        search = PROFESSION_SEARCHES["photographer"]
         data = await _search_professionals(
-            "real estate photographer photography", 
+            search.profession, 
             location, 
-            "property listing photos drone aerial"
+            search.keywords
         )
         
         tips = [
@@ -175,7 +250,7 @@ async def find_real_estate_photographer(location: Annotated[str, "City and state
         ]
         
         return _format_chatbot_response(
-            "Real Estate Photographers", 
+            search.title, 
             location, 
             data["results"], 
             tips
@@ -189,10 +264,11 @@ async def find_real_estate_photographer(location: Annotated[str, "City and state
 async def find_title_company(location: Annotated[str, "City and state to search for title companies"]) -> str:
     """Find local title companies and escrow services."""
     try:
+        search = PROFESSION_SEARCHES["title_company"]
         data = await _search_professionals(
-            "title company escrow", 
+            search.profession, 
             location, 
-            "real estate closing settlement insurance"
+            search.keywords
         )
         
         tips = [
@@ -203,7 +279,7 @@ async def find_title_company(location: Annotated[str, "City and state to search
         ]
         
         return _format_chatbot_response(
-            "Title Companies", 
+            search.title, 
             location, 
             data["results"], 
             tips
@@ -217,10 +293,11 @@ async def find_title_company(location: Annotated[str, "City and state to search
 async def find_mortgage_lender(location: Annotated[str, "City and state to search for lenders"]) -> str:
     """Find local mortgage lenders and banks."""
     try:
+        search = PROFESSION_SEARCHES["lender"]
         data = await _search_professionals(
-            "mortgage lender bank", 
+            search.profession, 
             location, 
-            "home loan residential financing"
+            search.keywords
         )
         
         tips = [
@@ -231,7 +308,7 @@ async def find_mortgage_lender(location: Annotated[str, "City and state to searc
         ]
         
         return _format_chatbot_response(
-            "Mortgage Lenders", 
+            search.title, 
             location, 
             data["results"], 
             tips
@@ -245,10 +322,11 @@ async def find_mortgage_lender(location: Annotated[str, "City and state to searc
 async def find_home_inspector(location: Annotated[str, "City and state to search for inspectors"]) -> str:
     """Find local certified home inspectors."""
     try:
+        search = PROFESSION_SEARCHES["inspector"]
         data = await _search_professionals(
-            "home inspector inspection", 
+            search.profession, 
             location, 
-            "certified property structural mechanical"
+            search.keywords
         )
         
         tips = [
@@ -259,7 +337,7 @@ async def find_home_inspector(location: Annotated[str, "City and state to search
         ]
         
         return _format_chatbot_response(
-            "Home Inspectors", 
+            search.title, 
             location, 
             data["results"], 
             tips
@@ -273,10 +351,11 @@ async def find_home_inspector(location: Annotated[str, "City and state to search
 async def find_appraiser(location: Annotated[str, "City and state to search for appraisers"]) -> str:
     """Find local certified real estate appraisers."""
     try:
+        search = PROFESSION_SEARCHES["appraiser"]
         data = await _search_professionals(
-            "real estate appraiser", 
+            search.profession, 
             location, 
-            "certified residential property valuation"
+            search.keywords
         )
         
         tips = [
@@ -287,11 +366,80 @@ async def find_appraiser(location: Annotated[str, "City and state to search for
         ]
         
         return _format_chatbot_response(
-            "Real Estate Appraisers", 
+            search.title, 
             location, 
             data["results"], 
             tips
         )
         
     except Exception as e:
-        return f"❌ **Search Error**\n\nHad trouble finding appraisers in {location}.\nPlease try again or contact me for manual assistance."
\ No newline at end of file
+        return f"❌ **Search Error**\n\nHad trouble finding appraisers in {location}.\nPlease try again or contact me for manual assistance."
+
+
+async def _search_closing_team(location: str, roles: List[str]) -> Dict[str, List]:
+    """
+    Run every role's search concurrently and merge the results.
+
+    Returns {role: cards} in `roles` order. A business found by several
+    searches (an attorney's office that also handles title work, say) is
+    listed once, under the first role that found it. A role whose search
+    failed maps to an empty list; if every search failed the first error is raised.
+    """
+    searches = await asyncio.gather(
+        *[
+            _search_professionals(PROFESSION_SEARCHES[role].profession, location, PROFESSION_SEARCHES[role].keywords)
+            for role in roles
+        ],
+        return_exceptions=True
+    )
+    if all(isinstance(data, BaseException) for data in searches):
+        raise searches[0]
+
+    seen = set()
+    team = {}
+    for role, data in zip(roles, searches):
+        team[role] = []
+        if isinstance(data, BaseException):
+            continue
+        for card in data["results"]:
+            keys = card_keys(card) or {card.url}
+            if keys & seen:
+                continue
+            seen |= keys
+            team[role].append(card)
+    return team
+
+
+#@tool(name="find_closing_team", description="Find an attorney, title company, home inspector and appraiser for closing in one search")
+async def find_closing_team(
+    location: Annotated[str, "City and state to search for closing professionals"],
+    roles: Annotated[Optional[List[str]], "Roles to include: attorney, title_company, inspector, appraiser, lender, photographer"] = None
+) -> str:
+    """Find the professionals a seller needs to close (attorney, title company, inspector, appraiser) in one round."""
+    roles = [role for role in (roles or CLOSING_TEAM_ROLES) if role in PROFESSION_SEARCHES]
+    if not roles:
+        return f"❌ **Unknown Roles**\n\nChoose from: {', '.join(PROFESSION_SEARCHES)}."
+
+    try:
+        team = await _search_closing_team(location, roles)
+    except Exception as e:
+        logger.warning(f"Closing team search failed for {location}: {e}")
+        return f"❌ **Search Error**\n\nHad trouble finding your closing team in {location}.\nPlease try again or contact me for manual assistance."
+
+    response = f"""
+🤝 **Your Closing Team in {location}**
+
+"""
+    for role, cards in team.items():
+        title = PROFESSION_SEARCHES[role].title
+        response += f"\n### {title}\n"
+        if not cards:
+            response += f"No {title.lower()} found. Try a nearby city or ask local real estate offices for referrals.\n"
+            continue
+        for i, card in enumerate(cards[:CLOSING_TEAM_PER_ROLE], 1):
+            response += format_professional_card(card, i)
+
+    response += "\n💡 **Tip:** Line up your title company and attorney early, they set the closing timeline."
+    response += "\n\n💬 **Need more help?** Just ask!"
+
+    return response